@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+AWS Resource Manager
+Generic helper for listing resources and invoking operations on any AWS
+service through boto3, shared by the automation scripts.
+"""
+
+import boto3
+import json
+import logging
+import queue
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+from botocore.config import Config
+from botocore.exceptions import ClientError
+import argparse
+import sys
+import time
+
+# Read-only responses are memoized briefly so scripts that scan the same
+# service twice in one run (list-all plus a filtered pass) only hit the
+# API once; keyed by service/region/operation/params
+_RESPONSE_CACHE: Dict[tuple, Tuple[float, Any]] = {}
+RESPONSE_CACHE_TTL = 60.0
+_CACHEABLE_PREFIXES = ('list_', 'get_', 'describe_')
+
+# Single-flight table: identical read-only calls issued while one is
+# already in flight wait on its Future instead of hitting the API again
+_INFLIGHT: Dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Default list operation per service, used when the caller does not name one
+_DEFAULT_LIST_OP: Dict[str, str] = {
+    'ec2': 'describe_instances',
+    's3': 'list_buckets',
+    'lambda': 'list_functions',
+    'iam': 'list_users',
+    'rds': 'describe_db_instances',
+    'cloudformation': 'describe_stacks',
+    'sns': 'list_topics',
+    'sqs': 'list_queues',
+}
+
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGING_CONFIGURED = False
+
+
+def _configure_logging_once() -> None:
+    """Attach the module's handler and level exactly once.
+
+    Constructing many managers used to re-run handler setup per instance;
+    doing it once keeps a single StreamHandler no matter how many managers
+    exist, so log lines are never duplicated.
+    """
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    _LOGGER.setLevel(logging.INFO)
+    if not _LOGGER.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        ))
+        _LOGGER.addHandler(handler)
+    _LOGGING_CONFIGURED = True
+
+
+@lru_cache(maxsize=None)
+def _get_session(profile_name: Optional[str]) -> boto3.Session:
+    """Create (or reuse) a boto3 session for a profile.
+
+    Sessions resolve credentials and load botocore data on construction,
+    so they are cached per profile and shared across manager instances.
+    """
+    if profile_name:
+        return boto3.Session(profile_name=profile_name)
+    return boto3.Session()
+
+
+@lru_cache(maxsize=None)
+def _get_client(profile_name: Optional[str], region_name: str, service_name: str,
+                max_pool_connections: int = 50):
+    """Create (or reuse) a service client for a profile/region/service."""
+    # The default client config caps the HTTP pool at 10 connections and
+    # leaves TCP keep-alive off, both of which hurt under concurrency.
+    # Adaptive retry mode rate-limits client-side instead of retry-storming
+    # when describe/list calls get throttled; the AWS_RETRY_MODE and
+    # AWS_MAX_ATTEMPTS environment variables still take precedence.
+    config = Config(
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=True,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        user_agent_extra='aws-resource-manager'
+    )
+    return _get_session(profile_name).client(
+        service_name, region_name=region_name, config=config
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_resource(profile_name: Optional[str], region_name: str, service_name: str):
+    """Create (or reuse) a service resource, if the service supports one."""
+    try:
+        return _get_session(profile_name).resource(service_name, region_name=region_name)
+    except Exception:
+        # Many services (lambda, sts, ...) have no resource interface
+        return None
+
+
+def _prefetch_pages(pages: Iterator[Dict[str, Any]], depth: int) -> Iterator[Dict[str, Any]]:
+    """Yield pages while a background thread fetches up to `depth` ahead.
+
+    Page tokens make pagination inherently sequential, but fetching the
+    next page while the caller processes the current one hides the HTTP
+    round-trip behind consumer work.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    sentinel = object()
+
+    def _producer():
+        try:
+            for page in pages:
+                buffer.put(page)
+            buffer.put(sentinel)
+        except BaseException as e:
+            buffer.put(e)
+
+    threading.Thread(target=_producer, daemon=True).start()
+
+    while True:
+        item = buffer.get()
+        if item is sentinel:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+class AWSResourceManager:
+    """
+    Generic AWS resource manager wrapping a single service client.
+    """
+
+    # Operation listings per service, shared across instances
+    _ops_cache: Dict[str, List[str]] = {}
+
+    def __init__(self, service_name: str, region_name: str = 'us-east-1',
+                 profile_name: str = None, max_pool_connections: int = 50):
+        """Initialize the resource manager for one AWS service."""
+        self.service_name = service_name
+        self.region_name = region_name
+        self.profile_name = profile_name
+
+        # Handler/level setup happens once per process; each manager gets
+        # a child logger so records carry the service name
+        _configure_logging_once()
+        self.logger = _LOGGER.getChild(service_name)
+
+        # Session and client come from the shared caches, so building
+        # several managers only pays for construction once
+        self.session = _get_session(profile_name)
+        self.client = _get_client(profile_name, region_name, service_name,
+                                  max_pool_connections)
+
+    @cached_property
+    def resource(self):
+        """Service resource, built lazily on first access.
+
+        Most callers only use client operations, and many services have no
+        resource interface at all, so construction is deferred until needed.
+        """
+        return _get_resource(self.profile_name, self.region_name, self.service_name)
+
+    def list_resources(self, operation_name: str = None, max_items: int = None,
+                       page_size: int = None, eager: bool = False,
+                       prefetch_depth: int = 2, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        List resources using the service's default list operation,
+        yielding response pages lazily.
+
+        Args:
+            operation_name (str): Operation to call. If None, a common
+                default for the service is used.
+            max_items (int): Optional cap on total items paginated.
+            page_size (int): Optional per-page item count.
+            eager (bool): Prefetch upcoming pages in the background while
+                the caller processes the current one.
+            prefetch_depth (int): How many pages to buffer when eager.
+            **kwargs: Parameters passed through to the operation.
+
+        Yields:
+            Raw response page dicts from the API call
+        """
+        if operation_name is None:
+            operation_name = _DEFAULT_LIST_OP.get(self.service_name)
+            if operation_name is None:
+                raise ValueError(
+                    f"No default list operation known for service '{self.service_name}'"
+                )
+
+        if self.client.can_paginate(operation_name):
+            # Stream pages so large accounts see every result without the
+            # whole listing being held in memory at once
+            pagination_config = {}
+            if max_items is not None:
+                pagination_config['MaxItems'] = max_items
+            if page_size is not None:
+                pagination_config['PageSize'] = page_size
+            if pagination_config:
+                kwargs['PaginationConfig'] = pagination_config
+            try:
+                paginator = self.client.get_paginator(operation_name)
+                pages = paginator.paginate(**kwargs)
+                if eager:
+                    pages = _prefetch_pages(pages, prefetch_depth)
+                yield from pages
+                self.logger.info("Successfully paginated %s on %s", operation_name, self.service_name)
+                return
+            except ClientError as e:
+                self.logger.error("AWS error paginating %s: %s", operation_name, e)
+                raise
+
+        yield self.execute_operation(operation_name, **kwargs)
+
+    def _cache_key(self, operation_name: str, kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """Build a cache key for a read-only call, or None if not cacheable."""
+        if not operation_name.startswith(_CACHEABLE_PREFIXES):
+            return None
+        # repr gives a stable, hashable key even for nested filter dicts
+        return (self.service_name, self.region_name, operation_name,
+                repr(sorted(kwargs.items())))
+
+    def execute_operation(self, operation_name: str, use_cache: bool = True,
+                          **kwargs) -> Dict[str, Any]:
+        """
+        Execute an arbitrary operation on the service client.
+
+        List/Get/Describe responses are cached for a short TTL; pass
+        use_cache=False to force a fresh call.
+
+        Args:
+            operation_name (str): snake_case operation name
+            use_cache (bool): Serve recent read-only responses from cache
+            **kwargs: Parameters passed through to the operation
+
+        Returns:
+            Raw response dict from the API call
+        """
+        cache_key = self._cache_key(operation_name, kwargs) if use_cache else None
+        if cache_key is None:
+            return self._call(operation_name, kwargs)
+
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            self.logger.debug("Cache hit for %s", operation_name)
+            return cached[1]
+
+        # Single-flight: the first caller for this key issues the request;
+        # concurrent duplicates block on its Future, so a cache miss plus
+        # N concurrent identical calls still costs one API round-trip
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(cache_key)
+            leader = future is None
+            if leader:
+                future = Future()
+                _INFLIGHT[cache_key] = future
+        if not leader:
+            self.logger.debug("Joining in-flight %s", operation_name)
+            return future.result()
+
+        try:
+            response = self._call(operation_name, kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT.pop(cache_key, None)
+        _RESPONSE_CACHE[cache_key] = (time.monotonic() + RESPONSE_CACHE_TTL, response)
+        future.set_result(response)
+        return response
+
+    def _call(self, operation_name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Issue one client call with the standard logging around it."""
+        try:
+            operation = getattr(self.client, operation_name)
+            response = operation(**kwargs)
+            self.logger.info("Successfully called %s on %s", operation_name, self.service_name)
+            return response
+        except AttributeError:
+            self.logger.error("Unknown operation: %s", operation_name)
+            raise
+        except ClientError as e:
+            self.logger.error("AWS error calling %s: %s", operation_name, e)
+            raise
+        except Exception as e:
+            self.logger.error("Error calling %s: %s", operation_name, e)
+            raise
+
+    def execute_operations(self, operation_name: str,
+                           kwargs_list: List[Dict[str, Any]],
+                           max_workers: int = 16) -> Iterator[Tuple[int, Any]]:
+        """
+        Execute one operation concurrently for a list of parameter sets.
+
+        Clients are thread-safe, so per-item calls (e.g. get_bucket_location
+        for every bucket) can share this manager's client across a thread
+        pool instead of looping serially. The client's connection pool is
+        sized to 50 by default, so the default worker count stays well
+        inside it.
+
+        Args:
+            operation_name (str): snake_case operation name
+            kwargs_list (list): One kwargs dict per call
+            max_workers (int): Thread pool size
+
+        Yields:
+            (index, result) tuples as calls complete, where index is the
+            position of the kwargs dict in kwargs_list. A failed call
+            yields its exception as the result.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.execute_operation, operation_name, **kw): i
+                for i, kw in enumerate(kwargs_list)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    yield index, future.result()
+                except Exception as e:
+                    self.logger.error("Error in batched %s [%d]: %s", operation_name, index, e)
+                    yield index, e
+
+    def get_available_operations(self) -> List[str]:
+        """Return the snake_case operation names available on the client."""
+        ops = self._ops_cache.get(self.service_name)
+        if ops is None:
+            # The service model already holds the operation list; use it
+            # instead of a dir() + callable() scan over every attribute
+            transform = self.client.meta.method_to_api_mapping
+            ops = sorted(transform.keys())
+            self._ops_cache[self.service_name] = ops
+        return ops
+
+    def print_response(self, response: Dict[str, Any], indent: int = 2) -> None:
+        """Pretty print response data, streaming straight to stdout."""
+        try:
+            if orjson is not None:
+                # orjson serializes several times faster and handles
+                # datetimes natively; write its bytes straight to the
+                # underlying buffer
+                sys.stdout.flush()
+                sys.stdout.buffer.write(
+                    orjson.dumps(response, option=orjson.OPT_INDENT_2, default=str)
+                )
+                sys.stdout.buffer.write(b'\n')
+                sys.stdout.buffer.flush()
+                return
+            # json.dump writes incrementally instead of materializing the
+            # whole serialized payload as one string first
+            json.dump(response, sys.stdout, indent=indent, default=str)
+            sys.stdout.write('\n')
+        except Exception as e:
+            self.logger.error("Error printing response: %s", e)
+            print(str(response))
+
+
+def main():
+    """Main command line interface."""
+    parser = argparse.ArgumentParser(description='Generic AWS Resource Manager')
+    parser.add_argument('service', help='AWS service name (e.g. ec2, s3, lambda)')
+    parser.add_argument('--region', default='us-east-1', help='AWS region (default: us-east-1)')
+    parser.add_argument('--profile', help='AWS profile name')
+    parser.add_argument('--operation', help='Operation to execute (default: service list operation)')
+    parser.add_argument('--params', help='JSON-encoded parameters for the operation')
+    parser.add_argument('--list-operations', action='store_true',
+                        help='List available operations for the service')
+
+    args = parser.parse_args()
+
+    try:
+        if args.list_operations:
+            # Operation names come straight from the bundled service model,
+            # so no client, credentials, or network access is needed
+            from botocore import xform_name
+            from botocore.session import Session as BotocoreSession
+            service_model = BotocoreSession().get_service_model(args.service)
+            print(f"Available operations for {args.service}:")
+            for op in sorted(xform_name(name) for name in service_model.operation_names):
+                print(f"  {op}")
+            return
+
+        manager = AWSResourceManager(
+            service_name=args.service,
+            region_name=args.region,
+            profile_name=args.profile
+        )
+
+        params = json.loads(args.params) if args.params else {}
+
+        if args.operation:
+            manager.print_response(manager.execute_operation(args.operation, **params))
+        else:
+            for page in manager.list_resources(**params):
+                manager.print_response(page)
+
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
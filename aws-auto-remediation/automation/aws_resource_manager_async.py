@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Async AWS Resource Manager
+
+asyncio counterpart to AWSResourceManager for workflows that fan out many
+independent AWS calls. A single event loop multiplexes the requests over
+one persistent client, avoiding per-call thread stack and lock overhead.
+
+Requires the optional aiobotocore dependency:
+
+    pip install aiobotocore
+"""
+
+import logging
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+try:
+    from aiobotocore.session import get_session
+except ImportError:
+    get_session = None
+
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from aws_resource_manager import _DEFAULT_LIST_OP
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAWSResourceManager:
+    """
+    Async AWS resource manager wrapping a single persistent service client.
+
+    Use as an async context manager so the client and its connection pool
+    live for the whole workflow:
+
+        async with AsyncAWSResourceManager('ec2') as manager:
+            response = await manager.execute_operation('describe_instances')
+    """
+
+    def __init__(self, service_name: str, region_name: str = 'us-east-1',
+                 max_pool_connections: int = 50):
+        """Initialize the async resource manager for one AWS service."""
+        if get_session is None:
+            raise ImportError(
+                "aiobotocore is required for AsyncAWSResourceManager: "
+                "pip install aiobotocore"
+            )
+        self.service_name = service_name
+        self.region_name = region_name
+        self.logger = logger.getChild(service_name)
+        self._session = get_session()
+        self._config = Config(
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            user_agent_extra='aws-resource-manager'
+        )
+        self._client_cm = None
+        self.client = None
+
+    async def __aenter__(self) -> 'AsyncAWSResourceManager':
+        self._client_cm = self._session.create_client(
+            self.service_name, region_name=self.region_name, config=self._config
+        )
+        self.client = await self._client_cm.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._client_cm.__aexit__(exc_type, exc, tb)
+        self.client = None
+
+    async def execute_operation(self, operation_name: str, **kwargs) -> Dict[str, Any]:
+        """Execute an arbitrary operation on the service client."""
+        try:
+            operation = getattr(self.client, operation_name)
+            response = await operation(**kwargs)
+            self.logger.debug("Called %s on %s", operation_name, self.service_name)
+            return response
+        except AttributeError:
+            self.logger.error("Unknown operation: %s", operation_name)
+            raise
+        except ClientError as e:
+            self.logger.error("AWS error calling %s: %s", operation_name, e)
+            raise
+
+    async def list_resources(self, operation_name: str = None,
+                             max_items: int = None, page_size: int = None,
+                             **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        List resources using the service's default list operation,
+        yielding response pages as they arrive.
+        """
+        if operation_name is None:
+            operation_name = _DEFAULT_LIST_OP.get(self.service_name)
+            if operation_name is None:
+                raise ValueError(
+                    f"No default list operation known for service '{self.service_name}'"
+                )
+
+        if self.client.can_paginate(operation_name):
+            pagination_config = {}
+            if max_items is not None:
+                pagination_config['MaxItems'] = max_items
+            if page_size is not None:
+                pagination_config['PageSize'] = page_size
+            if pagination_config:
+                kwargs['PaginationConfig'] = pagination_config
+            paginator = self.client.get_paginator(operation_name)
+            async for page in paginator.paginate(**kwargs):
+                yield page
+            return
+
+        yield await self.execute_operation(operation_name, **kwargs)
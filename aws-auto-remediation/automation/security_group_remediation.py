@@ -4,14 +4,118 @@ Security Group Remediation Tool
 Direct AWS security group remediation tool using boto3.
 """
 
-import boto3
 import json
 import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
-from botocore.exceptions import ClientError, NoCredentialsError
 import argparse
+import ipaddress
 import sys
+import time
+from bisect import bisect_left
+from functools import lru_cache
+
+# boto3/botocore dominate cold-start time, so they are imported lazily on
+# first use rather than at module import; --help never pays for them
+boto3 = None
+Config = None
+NoCredentialsError = None
+
+
+def _lazy_boto():
+    """Import boto3 and botocore on first use."""
+    global boto3, Config, NoCredentialsError
+    if boto3 is None:
+        import boto3 as _boto3
+        from botocore.config import Config as _Config
+        from botocore.exceptions import NoCredentialsError as _NoCredentialsError
+        boto3 = _boto3
+        Config = _Config
+        NoCredentialsError = _NoCredentialsError
+
+# Shared log handler/formatter, built once at import instead of per instance
+_LOG_FORMAT = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_LOG_HANDLER = logging.StreamHandler()
+_LOG_HANDLER.setFormatter(_LOG_FORMAT)
+
+# How long cached DescribeSecurityGroups results stay valid (seconds)
+SG_CACHE_TTL = 60.0
+
+# Sessions and EC2 clients shared across remediator instances, keyed by
+# (profile, region); avoids repeated endpoint resolution and TLS setup
+_SESSION_CACHE: Dict[Optional[str], Any] = {}
+_CLIENT_CACHE: Dict[Tuple[Optional[str], str], Any] = {}
+
+# Risk classification port sets (SSH/RDP vs database ports)
+HIGH_RISK_PORTS = frozenset([22, 3389])
+MEDIUM_RISK_PORTS = frozenset([1433, 3306, 5432, 6379, 27017])
+
+# Port -> risk level lookup built once at import; anything unlisted is Low
+_PORT_RISK = {**{p: 'High' for p in HIGH_RISK_PORTS},
+              **{p: 'Medium' for p in MEDIUM_RISK_PORTS}}
+_RISK_ORDER = {'Low': 0, 'Medium': 1, 'High': 2}
+
+def _dumps(obj: Any, pretty: bool = True) -> str:
+    """Serialize to JSON, using orjson when installed for large payloads."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2 if pretty else None, default=str)
+
+
+# Entire IPv4/IPv6 address space, for detecting world-open rules
+_WORLD_V4 = ipaddress.ip_network('0.0.0.0/0')
+_WORLD_V6 = ipaddress.ip_network('::/0')
+
+
+@lru_cache(maxsize=4096)
+def _parse_network(cidr: str):
+    """Parse a CIDR string once; rules repeat the same blocks constantly."""
+    try:
+        return ipaddress.ip_network(cidr, strict=False)
+    except ValueError:
+        return None
+
+
+def _minimize_cidrs(cidrs: List[str]) -> List[str]:
+    """Collapse a CIDR list into the minimum set of covering blocks.
+
+    Adjacent and overlapping blocks are merged (e.g. two /24s into a /23),
+    which keeps replacement rules within the security group rule cap when
+    callers pass long allow-lists. Unparseable entries are kept verbatim.
+    """
+    networks = []
+    passthrough = []
+    for cidr in cidrs:
+        network = _parse_network(cidr)
+        if network is not None:
+            networks.append(network)
+        else:
+            passthrough.append(cidr)
+    v4 = [n for n in networks if n.version == 4]
+    v6 = [n for n in networks if n.version == 6]
+    collapsed = list(ipaddress.collapse_addresses(v4)) + list(ipaddress.collapse_addresses(v6))
+    return [str(n) for n in collapsed] + passthrough
+
+
+def _covers_world(cidrs: Tuple[str, ...], world) -> bool:
+    """Check whether the CIDRs, taken together, cover the whole address space."""
+    networks = [n for n in (_parse_network(c) for c in cidrs)
+                if n is not None and n.version == world.version]
+    if not networks:
+        return False
+    if any(n.prefixlen == 0 for n in networks):
+        return True
+    # Catch supernets split across ranges, e.g. 0.0.0.0/1 + 128.0.0.0/1
+    return list(ipaddress.collapse_addresses(networks)) == [world]
 
 
 class SecurityGroupRemediator:
@@ -19,11 +123,16 @@ class SecurityGroupRemediator:
     AWS Security Group Remediation Tool using direct boto3 calls.
     """
     
-    def __init__(self, region_name: str = 'us-east-1', profile_name: str = None):
+    def __init__(self, region_name: str = 'us-east-1', profile_name: str = None,
+                 page_size: int = 1000, worker_count: int = 16):
         """Initialize the Security Group Remediator."""
+        _lazy_boto()
         self.region_name = region_name
         self.profile_name = profile_name
-        self.risky_ports = [22, 3389, 1433, 3306, 5432, 6379, 27017, 9200, 5601]
+        self.page_size = page_size
+        self.worker_count = worker_count
+        self.risky_ports = frozenset([22, 3389, 1433, 3306, 5432, 6379, 27017, 9200, 5601])
+        self._sorted_risky = sorted(self.risky_ports)
         
         # Configure logging
         self.logger = self._setup_logging()
@@ -31,70 +140,150 @@ class SecurityGroupRemediator:
         # Initialize boto3 session and client
         self.session = self._create_session()
         self.ec2_client = self._create_ec2_client()
+
+        # TTL cache of describe results keyed by filter tuple, so the common
+        # report-then-remediate flow only hits DescribeSecurityGroups once
+        self._sg_cache: Dict[tuple, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
     
     def _setup_logging(self) -> logging.Logger:
-        """Setup logging configuration."""
+        """Setup logging configuration (idempotent, shared handler)."""
         logger = logging.getLogger(__name__)
         logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        
+
+        if _LOG_HANDLER not in logger.handlers:
+            logger.addHandler(_LOG_HANDLER)
+
         return logger
     
-    def _create_session(self) -> boto3.Session:
-        """Create boto3 session with optional profile."""
+    def _create_session(self) -> 'boto3.Session':
+        """Create or reuse a boto3 session with optional profile."""
         try:
-            if self.profile_name:
-                session = boto3.Session(profile_name=self.profile_name)
-                self.logger.info(f"Created session with profile: {self.profile_name}")
-            else:
-                session = boto3.Session()
-                self.logger.info("Created default session")
+            session = _SESSION_CACHE.get(self.profile_name)
+            if session is None:
+                if self.profile_name:
+                    session = boto3.Session(profile_name=self.profile_name)
+                    self.logger.info("Created session with profile: %s", self.profile_name)
+                else:
+                    session = boto3.Session()
+                    self.logger.info("Created default session")
+                _SESSION_CACHE[self.profile_name] = session
             return session
         except Exception as e:
-            self.logger.error(f"Failed to create session: {e}")
+            self.logger.error("Failed to create session: %s", e)
             raise
-    
-    def _create_ec2_client(self) -> boto3.client:
-        """Create boto3 EC2 client."""
+
+    def _create_ec2_client(self) -> 'boto3.client':
+        """Create or reuse a boto3 EC2 client for this profile/region."""
         try:
-            client = self.session.client('ec2', region_name=self.region_name)
-            self.logger.info(f"Created EC2 client in region {self.region_name}")
+            cache_key = (self.profile_name, self.region_name)
+            client = _CLIENT_CACHE.get(cache_key)
+            if client is not None:
+                return client
+            # Size the HTTP pool to the worker count and let adaptive retries
+            # absorb throttling when remediations run in parallel
+            config = Config(
+                max_pool_connections=max(32, self.worker_count),
+                retries={'mode': 'adaptive', 'max_attempts': 10},
+                tcp_keepalive=True
+            )
+            client = self.session.client('ec2', region_name=self.region_name, config=config)
+            _CLIENT_CACHE[cache_key] = client
+            self.logger.info("Created EC2 client in region %s", self.region_name)
             return client
         except NoCredentialsError:
             self.logger.error("AWS credentials not found")
             raise
         except Exception as e:
-            self.logger.error(f"Failed to create EC2 client: {e}")
+            self.logger.error("Failed to create EC2 client: %s", e)
             raise
     
-    def find_open_security_groups(self, ports: List[int] = None) -> List[Dict[str, Any]]:
+    def _iter_security_groups(self, filters: List[Dict[str, Any]] = None):
+        """Yield security groups one page at a time via the EC2 paginator."""
+        paginator = self.ec2_client.get_paginator('describe_security_groups')
+        kwargs = {'PaginationConfig': {'PageSize': self.page_size}}
+        if filters:
+            kwargs['Filters'] = filters
+        for page in paginator.paginate(**kwargs):
+            for sg in page.get('SecurityGroups', []):
+                yield sg
+
+    def _describe_all(self, filters: List[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """Return all matching security groups keyed by GroupId, with a TTL cache."""
+        key = tuple((f['Name'], tuple(f['Values'])) for f in filters) if filters else ()
+        now = time.monotonic()
+        cached = self._sg_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+        by_id = {sg['GroupId']: sg for sg in self._iter_security_groups(filters)}
+        self._sg_cache[key] = (now + SG_CACHE_TTL, by_id)
+        return by_id
+
+    def _get_security_group(self, group_id: str) -> Dict[str, Any]:
+        """Look up a security group in cached describe results, fetching on miss."""
+        now = time.monotonic()
+        for expiry, by_id in self._sg_cache.values():
+            if expiry > now and group_id in by_id:
+                return by_id[group_id]
+        response = self.ec2_client.describe_security_groups(GroupIds=[group_id])
+        return response['SecurityGroups'][0]
+
+    def _invalidate_cached_group(self, group_id: str) -> None:
+        """Drop a group from the cache after its rules have been modified."""
+        for _, by_id in self._sg_cache.values():
+            by_id.pop(group_id, None)
+
+    @staticmethod
+    def _ports_overlap(sorted_ports: List[int], from_port: int, to_port: int) -> bool:
+        """Check whether any watched port falls inside the rule's port range.
+
+        The ports are sorted once by the caller, so overlap reduces to
+        finding the first port >= from_port and comparing it to to_port.
         """
-        Find security groups with ingress rules open to 0.0.0.0/0.
-        
+        i = bisect_left(sorted_ports, from_port)
+        return i < len(sorted_ports) and sorted_ports[i] <= to_port
+
+    def _iter_open_security_groups(self, ports=None):
+        """
+        Yield security groups with ingress rules open to 0.0.0.0/0, one at a time.
+
         Args:
             ports (List[int]): Specific ports to check. If None, checks common risky ports.
-            
-        Returns:
-            List of security groups with open ingress rules
+
+        Yields:
+            Security group info dicts with their open ingress rules
         """
         if ports is None:
             ports = self.risky_ports
-        
+        elif ports != 'all':
+            ports = frozenset(ports)
+
+        # Sort once so the per-rule overlap test is a single bisect
+        if ports == 'all':
+            sorted_ports = None
+        elif ports is self.risky_ports:
+            sorted_ports = self._sorted_risky
+        else:
+            sorted_ports = sorted(ports)
+
+        # Only groups with a world-open ingress rule can match, so push that
+        # predicate to EC2 instead of filtering every group locally. EC2
+        # ANDs distinct filter names, so the IPv4 0.0.0.0/0 and IPv6 ::/0
+        # literals need one paginated pass each, merged by GroupId. Groups
+        # that are world-open only via split supernets (0.0.0.0/1 +
+        # 128.0.0.0/1) cannot be expressed as a server-side filter and are
+        # not returned by either pass; _covers_world still classifies such
+        # rules on any group the filters do return.
+        candidate_filters = (
+            [{'Name': 'ip-permission.cidr', 'Values': ['0.0.0.0/0']}],
+            [{'Name': 'ip-permission.ipv6-cidr', 'Values': ['::/0']}],
+        )
+
         try:
-            # Get all security groups
-            response = self.ec2_client.describe_security_groups()
-            security_groups = response.get('SecurityGroups', [])
-            
-            open_sgs = []
-            
-            for sg in security_groups:
+            candidates: Dict[str, Dict[str, Any]] = {}
+            for filters in candidate_filters:
+                candidates.update(self._describe_all(filters))
+
+            for sg in candidates.values():
                 sg_info = {
                     'GroupId': sg['GroupId'],
                     'GroupName': sg['GroupName'],
@@ -102,37 +291,60 @@ class SecurityGroupRemediator:
                     'VpcId': sg.get('VpcId'),
                     'OpenRules': []
                 }
-                
+
                 # Check each ingress rule
                 for rule in sg.get('IpPermissions', []):
                     from_port = rule.get('FromPort')
                     to_port = rule.get('ToPort')
                     protocol = rule.get('IpProtocol')
-                    
-                    # Check if rule allows 0.0.0.0/0
-                    for ip_range in rule.get('IpRanges', []):
-                        if ip_range.get('CidrIp') == '0.0.0.0/0':
-                            # Check if it's a risky port or if we're checking all ports
-                            if (ports == 'all' or 
-                                protocol == '-1' or  # All protocols
-                                (from_port is not None and any(port >= from_port and port <= to_port for port in ports))):
-                                
-                                sg_info['OpenRules'].append({
-                                    'IpProtocol': protocol,
-                                    'FromPort': from_port,
-                                    'ToPort': to_port,
-                                    'CidrIp': '0.0.0.0/0',
-                                    'Description': ip_range.get('Description', 'No description')
-                                })
-                
+
+                    # Check if the rule's ranges cover the whole internet,
+                    # including equivalent supernets like 0.0.0.0/1+128.0.0.0/1
+                    v4_ranges = rule.get('IpRanges', [])
+                    v6_ranges = rule.get('Ipv6Ranges', [])
+                    if _covers_world(tuple(r['CidrIp'] for r in v4_ranges if 'CidrIp' in r), _WORLD_V4):
+                        open_cidr = '0.0.0.0/0'
+                        open_ranges = v4_ranges
+                    elif _covers_world(tuple(r['CidrIpv6'] for r in v6_ranges if 'CidrIpv6' in r), _WORLD_V6):
+                        open_cidr = '::/0'
+                        open_ranges = v6_ranges
+                    else:
+                        continue
+
+                    # Check if it's a risky port or if we're checking all ports
+                    if (ports == 'all' or
+                        protocol == '-1' or  # All protocols
+                        (from_port is not None and self._ports_overlap(sorted_ports, from_port, to_port))):
+
+                        sg_info['OpenRules'].append({
+                            'IpProtocol': protocol,
+                            'FromPort': from_port,
+                            'ToPort': to_port,
+                            'CidrIp': open_cidr,
+                            'Description': next(
+                                (r['Description'] for r in open_ranges if r.get('Description')),
+                                'No description'
+                            )
+                        })
+
                 if sg_info['OpenRules']:
-                    open_sgs.append(sg_info)
-            
-            return open_sgs
-            
+                    yield sg_info
+
         except Exception as e:
-            self.logger.error(f"Error finding open security groups: {e}")
+            self.logger.error("Error finding open security groups: %s", e)
             raise
+
+    def find_open_security_groups(self, ports: List[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find security groups with ingress rules open to 0.0.0.0/0.
+
+        Args:
+            ports (List[int]): Specific ports to check. If None, checks common risky ports.
+
+        Returns:
+            List of security groups with open ingress rules
+        """
+        return list(self._iter_open_security_groups(ports))
     
     def remediate_security_group(self, group_id: str, replacement_cidrs: List[str] = None, 
                                dry_run: bool = True) -> Dict[str, Any]:
@@ -147,14 +359,72 @@ class SecurityGroupRemediator:
         Returns:
             Dict containing remediation results
         """
+        try:
+            # Get security group details, reusing cached describe results
+            sg = self._get_security_group(group_id)
+            return self._remediate_from_sg(sg, replacement_cidrs, dry_run)
+        except Exception as e:
+            self.logger.error("Error remediating security group %s: %s", group_id, e)
+            raise
+
+    def _plan(self, sg: Dict[str, Any], replacement_cidrs: List[str]) -> Tuple[List[Dict], List[Dict]]:
+        """Build the revoke/replacement rule lists for a raw security group dict."""
+        # Find rules with 0.0.0.0/0, grouped into canonical form: one
+        # entry per (protocol, from_port, to_port) with the union of its
+        # open ranges, so duplicated rules are revoked/replaced only once
+        open_by_key: Dict[Tuple, List[Dict[str, Any]]] = {}
+
+        for rule in sg.get('IpPermissions', []):
+            open_ranges = [ip_range for ip_range in rule.get('IpRanges', [])
+                         if ip_range.get('CidrIp') == '0.0.0.0/0']
+
+            if open_ranges:
+                key = (rule['IpProtocol'], rule.get('FromPort'), rule.get('ToPort'))
+                seen = open_by_key.setdefault(key, [])
+                seen_cidrs = {r['CidrIp'] for r in seen}
+                seen.extend(r for r in open_ranges if r['CidrIp'] not in seen_cidrs)
+
+        rules_to_revoke = []
+        rules_to_add = []
+
+        for (protocol, from_port, to_port), open_ranges in open_by_key.items():
+            # Create revoke rule
+            revoke_rule = {
+                'IpProtocol': protocol,
+                'IpRanges': open_ranges
+            }
+
+            if from_port is not None:
+                revoke_rule['FromPort'] = from_port
+            if to_port is not None:
+                revoke_rule['ToPort'] = to_port
+
+            rules_to_revoke.append(revoke_rule)
+
+            # Create one replacement rule covering all CIDRs for this
+            # protocol/port tuple instead of one rule per CIDR;
+            # dict.fromkeys drops duplicate CIDRs while keeping order
+            add_rule = revoke_rule.copy()
+            add_rule['IpRanges'] = [{
+                'CidrIp': cidr,
+                'Description': f'Remediated from 0.0.0.0/0 - {open_ranges[0].get("Description", "")}'
+            } for cidr in dict.fromkeys(replacement_cidrs)]
+            rules_to_add.append(add_rule)
+
+        return rules_to_revoke, rules_to_add
+
+    def _remediate_from_sg(self, sg: Dict[str, Any], replacement_cidrs: List[str] = None,
+                           dry_run: bool = True) -> Dict[str, Any]:
+        """Plan and execute remediation for an already-fetched security group."""
         if replacement_cidrs is None:
             replacement_cidrs = ['10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16']  # Private networks
-        
+        else:
+            # Collapse caller-supplied allow-lists into minimal covering blocks
+            replacement_cidrs = _minimize_cidrs(replacement_cidrs)
+
+        group_id = sg['GroupId']
+
         try:
-            # Get security group details
-            response = self.ec2_client.describe_security_groups(GroupIds=[group_id])
-            sg = response['SecurityGroups'][0]
-            
             remediation_plan = {
                 'GroupId': group_id,
                 'GroupName': sg['GroupName'],
@@ -163,76 +433,72 @@ class SecurityGroupRemediator:
                 'RulesAdded': [],
                 'Errors': []
             }
-            
-            # Find rules with 0.0.0.0/0
-            rules_to_revoke = []
-            rules_to_add = []
-            
-            for rule in sg.get('IpPermissions', []):
-                open_ranges = [ip_range for ip_range in rule.get('IpRanges', []) 
-                             if ip_range.get('CidrIp') == '0.0.0.0/0']
-                
-                if open_ranges:
-                    # Create revoke rule
-                    revoke_rule = {
-                        'IpProtocol': rule['IpProtocol'],
-                        'IpRanges': open_ranges
-                    }
-                    
-                    if 'FromPort' in rule:
-                        revoke_rule['FromPort'] = rule['FromPort']
-                    if 'ToPort' in rule:
-                        revoke_rule['ToPort'] = rule['ToPort']
-                    
-                    rules_to_revoke.append(revoke_rule)
-                    
-                    # Create replacement rules
-                    for cidr in replacement_cidrs:
-                        add_rule = revoke_rule.copy()
-                        add_rule['IpRanges'] = [{
-                            'CidrIp': cidr,
-                            'Description': f'Remediated from 0.0.0.0/0 - {open_ranges[0].get("Description", "")}'
-                        }]
-                        rules_to_add.append(add_rule)
-            
+
+            rules_to_revoke, rules_to_add = self._plan(sg, replacement_cidrs)
+
             # Execute remediation
             if not dry_run:
-                # Revoke open rules
-                for rule in rules_to_revoke:
+                # Revoke open rules in a single batched call; fall back to
+                # per-rule calls to isolate the bad entry if the batch fails
+                if rules_to_revoke:
                     try:
                         self.ec2_client.revoke_security_group_ingress(
                             GroupId=group_id,
-                            IpPermissions=[rule]
+                            IpPermissions=rules_to_revoke
                         )
-                        remediation_plan['RulesRevoked'].append(rule)
-                        self.logger.info(f"Revoked rule: {rule}")
+                        remediation_plan['RulesRevoked'].extend(rules_to_revoke)
+                        self.logger.info("Revoked %d rules in one call", len(rules_to_revoke))
                     except Exception as e:
-                        error_msg = f"Failed to revoke rule {rule}: {e}"
-                        remediation_plan['Errors'].append(error_msg)
-                        self.logger.error(error_msg)
-                
-                # Add replacement rules
-                for rule in rules_to_add:
+                        self.logger.warning("Batch revoke failed (%s), retrying per rule", e)
+                        for rule in rules_to_revoke:
+                            try:
+                                self.ec2_client.revoke_security_group_ingress(
+                                    GroupId=group_id,
+                                    IpPermissions=[rule]
+                                )
+                                remediation_plan['RulesRevoked'].append(rule)
+                                self.logger.info("Revoked rule: %s", rule)
+                            except Exception as e:
+                                error_msg = f"Failed to revoke rule {rule}: {e}"
+                                remediation_plan['Errors'].append(error_msg)
+                                self.logger.error(error_msg)
+
+                # Add replacement rules, batched the same way
+                if rules_to_add:
                     try:
                         self.ec2_client.authorize_security_group_ingress(
                             GroupId=group_id,
-                            IpPermissions=[rule]
+                            IpPermissions=rules_to_add
                         )
-                        remediation_plan['RulesAdded'].append(rule)
-                        self.logger.info(f"Added rule: {rule}")
+                        remediation_plan['RulesAdded'].extend(rules_to_add)
+                        self.logger.info("Added %d rules in one call", len(rules_to_add))
                     except Exception as e:
-                        error_msg = f"Failed to add rule {rule}: {e}"
-                        remediation_plan['Errors'].append(error_msg)
-                        self.logger.error(error_msg)
+                        self.logger.warning("Batch authorize failed (%s), retrying per rule", e)
+                        for rule in rules_to_add:
+                            try:
+                                self.ec2_client.authorize_security_group_ingress(
+                                    GroupId=group_id,
+                                    IpPermissions=[rule]
+                                )
+                                remediation_plan['RulesAdded'].append(rule)
+                                self.logger.info("Added rule: %s", rule)
+                            except Exception as e:
+                                error_msg = f"Failed to add rule {rule}: {e}"
+                                remediation_plan['Errors'].append(error_msg)
+                                self.logger.error(error_msg)
+
+                # Cached describe data is stale once the group's rules changed
+                if remediation_plan['RulesRevoked'] or remediation_plan['RulesAdded']:
+                    self._invalidate_cached_group(group_id)
             else:
                 remediation_plan['RulesRevoked'] = rules_to_revoke
                 remediation_plan['RulesAdded'] = rules_to_add
-                self.logger.info(f"DRY RUN: Would revoke {len(rules_to_revoke)} rules and add {len(rules_to_add)} rules")
+                self.logger.info("DRY RUN: Would revoke %d rules and add %d rules", len(rules_to_revoke), len(rules_to_add))
             
             return remediation_plan
             
         except Exception as e:
-            self.logger.error(f"Error remediating security group {group_id}: {e}")
+            self.logger.error("Error remediating security group %s: %s", group_id, e)
             raise
     
     def bulk_remediate(self, replacement_cidrs: List[str] = None, 
@@ -249,20 +515,35 @@ class SecurityGroupRemediator:
             List of remediation results for each security group
         """
         try:
-            open_sgs = self.find_open_security_groups(ports)
             results = []
-            
-            self.logger.info(f"Found {len(open_sgs)} security groups with open rules")
-            
-            for sg in open_sgs:
-                self.logger.info(f"Remediating security group: {sg['GroupId']} ({sg['GroupName']})")
-                result = self.remediate_security_group(sg['GroupId'], replacement_cidrs, dry_run)
-                results.append(result)
-            
+
+            # Remediations are independent per group and network-bound, so
+            # dispatch them through a bounded thread pool; the EC2 client is
+            # thread-safe and its connection pool is sized to match
+            with ThreadPoolExecutor(max_workers=self.worker_count) as executor:
+                futures = {}
+                for sg in self._iter_open_security_groups(ports):
+                    self.logger.info("Remediating security group: %s (%s)", sg['GroupId'], sg['GroupName'])
+                    # The raw group is already in the describe cache from the
+                    # scan, so remediate from it without another fetch
+                    future = executor.submit(
+                        self._remediate_from_sg, self._get_security_group(sg['GroupId']),
+                        replacement_cidrs, dry_run
+                    )
+                    futures[future] = sg['GroupId']
+
+                for future in as_completed(futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        self.logger.error("Failed to remediate %s: %s", futures[future], e)
+
+            self.logger.info("Remediated %d security groups with open rules", len(results))
+
             return results
             
         except Exception as e:
-            self.logger.error(f"Error in bulk remediation: {e}")
+            self.logger.error("Error in bulk remediation: %s", e)
             raise
     
     def generate_remediation_report(self, output_file: str = None) -> Dict[str, Any]:
@@ -276,12 +557,18 @@ class SecurityGroupRemediator:
             Dict containing the report data
         """
         try:
-            open_sgs = self.find_open_security_groups('all')
-            
+            if output_file:
+                # Stream one security group at a time so peak memory stays
+                # bounded regardless of account size
+                with open(output_file, 'w') as f:
+                    summary = self._stream_report(f)
+                self.logger.info("Report saved to %s", output_file)
+                return summary
+
             report = {
                 'Timestamp': datetime.now().isoformat(),
                 'Region': self.region_name,
-                'TotalSecurityGroups': len(open_sgs),
+                'TotalSecurityGroups': 0,
                 'SecurityGroups': [],
                 'Summary': {
                     'HighRisk': 0,    # SSH, RDP
@@ -289,50 +576,73 @@ class SecurityGroupRemediator:
                     'LowRisk': 0      # Other ports
                 }
             }
-            
-            high_risk_ports = [22, 3389]
-            medium_risk_ports = [1433, 3306, 5432, 6379, 27017]
-            
-            for sg in open_sgs:
-                sg_report = {
-                    'GroupId': sg['GroupId'],
-                    'GroupName': sg['GroupName'],
-                    'Description': sg['Description'],
-                    'VpcId': sg.get('VpcId', 'EC2-Classic'),
-                    'RiskLevel': 'Low',
-                    'OpenRules': sg['OpenRules']
-                }
-                
-                # Determine risk level
-                for rule in sg['OpenRules']:
-                    if rule['IpProtocol'] == '-1':  # All protocols
-                        sg_report['RiskLevel'] = 'High'
-                        break
-                    elif rule['FromPort'] in high_risk_ports:
-                        sg_report['RiskLevel'] = 'High'
-                    elif rule['FromPort'] in medium_risk_ports and sg_report['RiskLevel'] != 'High':
-                        sg_report['RiskLevel'] = 'Medium'
-                
+
+            for sg_report in self._iter_sg_reports():
                 report['SecurityGroups'].append(sg_report)
                 report['Summary'][f"{sg_report['RiskLevel']}Risk"] += 1
-            
-            if output_file:
-                with open(output_file, 'w') as f:
-                    json.dump(report, f, indent=2, default=str)
-                self.logger.info(f"Report saved to {output_file}")
-            
+
+            report['TotalSecurityGroups'] = len(report['SecurityGroups'])
+
             return report
-            
+
         except Exception as e:
-            self.logger.error(f"Error generating report: {e}")
+            self.logger.error("Error generating report: %s", e)
             raise
+
+    @staticmethod
+    def _risk_level(open_rules: List[Dict[str, Any]]) -> str:
+        """Classify a security group's risk from its open ingress rules."""
+        risk_level = 'Low'
+        for rule in open_rules:
+            # O(1) table lookup per rule; all-protocol rules are always High
+            level = 'High' if rule['IpProtocol'] == '-1' else _PORT_RISK.get(rule['FromPort'], 'Low')
+            if _RISK_ORDER[level] > _RISK_ORDER[risk_level]:
+                risk_level = level
+                if risk_level == 'High':
+                    break
+        return risk_level
+
+    def _iter_sg_reports(self):
+        """Yield per-group report entries with risk levels, one at a time."""
+        for sg in self._iter_open_security_groups('all'):
+            yield {
+                'GroupId': sg['GroupId'],
+                'GroupName': sg['GroupName'],
+                'Description': sg['Description'],
+                'VpcId': sg.get('VpcId', 'EC2-Classic'),
+                'RiskLevel': self._risk_level(sg['OpenRules']),
+                'OpenRules': sg['OpenRules']
+            }
+
+    def _stream_report(self, fp) -> Dict[str, Any]:
+        """Write the report to a file object incrementally; return the summary."""
+        summary = {'HighRisk': 0, 'MediumRisk': 0, 'LowRisk': 0}
+        total = 0
+        fp.write('{\n')
+        fp.write(f'"Timestamp": {_dumps(datetime.now().isoformat())},\n')
+        fp.write(f'"Region": {_dumps(self.region_name)},\n')
+        fp.write('"SecurityGroups": [')
+        for sg_report in self._iter_sg_reports():
+            fp.write(',\n' if total else '\n')
+            fp.write(_dumps(sg_report))
+            summary[f"{sg_report['RiskLevel']}Risk"] += 1
+            total += 1
+        fp.write('\n],\n')
+        fp.write(f'"TotalSecurityGroups": {total},\n')
+        fp.write(f'"Summary": {_dumps(summary)}\n')
+        fp.write('}\n')
+        return {
+            'Region': self.region_name,
+            'TotalSecurityGroups': total,
+            'Summary': summary
+        }
     
     def print_response(self, response: Dict[str, Any], indent: int = 2) -> None:
         """Pretty print response data."""
         try:
-            print(json.dumps(response, indent=indent, default=str))
+            print(_dumps(response))
         except Exception as e:
-            self.logger.error(f"Error printing response: {e}")
+            self.logger.error("Error printing response: %s", e)
             print(str(response))
 
 
@@ -390,7 +700,7 @@ def main():
             
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(open_sgs, f, indent=2, default=str)
+                    f.write(_dumps(open_sgs))
                 print(f"Results saved to {args.output}")
             else:
                 remediator.print_response({'OpenSecurityGroups': open_sgs})
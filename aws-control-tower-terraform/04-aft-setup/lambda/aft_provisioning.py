@@ -1,10 +1,46 @@
 import json
 import boto3
 import logging
+import threading
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Shared client config: adaptive retries absorb throttling during bursts of
+# new-account events, and the pool is reused across warm invocations
+_CFG = Config(retries={'mode': 'adaptive', 'max_attempts': 10}, max_pool_connections=10)
+_STS = boto3.client('sts', config=_CFG)
+_SNS = boto3.client('sns', config=_CFG)
+
+# Assumed-role credentials and sessions cached per account for the Lambda
+# container lifetime; refreshed when within 5 minutes of expiry
+_CRED_CACHE = {}
+_SESSION_CACHE = {}
+CRED_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Account-scoped service clients cached by (access key, service). Client
+# construction costs endpoint resolution and TLS setup, so warm containers
+# reuse them; keying by access key means a credential refresh naturally
+# stops hitting the stale client. The lock matters because the baseline
+# tasks run in a thread pool: client creation on a shared Session is not
+# thread-safe, and the cache check-then-set would otherwise race.
+_ACCOUNT_CLIENTS = {}
+_ACCOUNT_CLIENTS_LOCK = threading.Lock()
+
+
+def get_account_client(session, service):
+    """Return a cached service client for the session's credentials"""
+    key = (session.get_credentials().access_key, service)
+    with _ACCOUNT_CLIENTS_LOCK:
+        client = _ACCOUNT_CLIENTS.get(key)
+        if client is None:
+            client = session.client(service, config=_CFG)
+            _ACCOUNT_CLIENTS[key] = client
+    return client
+
 def handler(event, context):
     """
     AFT Account Provisioning Lambda Handler
@@ -68,24 +104,10 @@ def apply_aft_customizations(account_id, account_name):
     logger.info(f"Applying AFT customizations to account {account_id}")
     
     try:
-        # Assume role in the target account
-        sts_client = boto3.client('sts')
-        role_arn = f"arn:aws:iam::{account_id}:role/OrganizationAccountAccessRole"
-        
-        assumed_role = sts_client.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName=f"AFTCustomization-{account_id}"
-        )
-        
-        credentials = assumed_role['Credentials']
-        
-        # Create session with assumed role credentials
-        session = boto3.Session(
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken']
-        )
-        
+        # Reuse cached credentials while they have comfortable time left;
+        # warm containers then skip the STS round-trip entirely
+        session = get_account_session(account_id)
+
         # Apply baseline configurations
         apply_baseline_configurations(session, account_id, account_name)
         
@@ -95,28 +117,71 @@ def apply_aft_customizations(account_id, account_name):
         logger.error(f"Error applying customizations to account {account_id}: {str(e)}")
         raise
 
+def get_account_session(account_id):
+    """
+    Return a boto3 Session for the target account, assuming the role only
+    when no still-valid cached credentials exist for it
+    """
+    credentials = _CRED_CACHE.get(account_id)
+
+    if credentials and credentials['Expiration'] > datetime.now(timezone.utc) + CRED_REFRESH_MARGIN:
+        return _SESSION_CACHE[account_id]
+
+    role_arn = f"arn:aws:iam::{account_id}:role/OrganizationAccountAccessRole"
+
+    assumed_role = _STS.assume_role(
+        RoleArn=role_arn,
+        RoleSessionName=f"AFTCustomization-{account_id}",
+        DurationSeconds=3600
+    )
+
+    credentials = assumed_role['Credentials']
+
+    # Create session with assumed role credentials
+    session = boto3.Session(
+        aws_access_key_id=credentials['AccessKeyId'],
+        aws_secret_access_key=credentials['SecretAccessKey'],
+        aws_session_token=credentials['SessionToken']
+    )
+
+    _CRED_CACHE[account_id] = credentials
+    _SESSION_CACHE[account_id] = session
+
+    return session
+
 def apply_baseline_configurations(session, account_id, account_name):
     """
     Apply baseline configurations to the account
     """
     logger.info(f"Applying baseline configurations to {account_id}")
-    
-    # Enable CloudTrail
-    enable_cloudtrail(session, account_id)
-    
-    # Configure Config
-    configure_config_service(session, account_id)
-    
-    # Set up GuardDuty
-    setup_guardduty(session, account_id)
-    
-    # Configure SecurityHub
-    configure_securityhub(session, account_id)
+
+    # Each baseline service is independent, so enable them concurrently
+    # instead of paying four sequential API round-trips of Lambda time.
+    # Each task obtains its client through get_account_client, which
+    # serializes creation on the shared session.
+    baseline_tasks = [
+        enable_cloudtrail,
+        configure_config_service,
+        setup_guardduty,
+        configure_securityhub,
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(baseline_tasks)) as executor:
+        futures = {
+            executor.submit(task, session, account_id): task.__name__
+            for task in baseline_tasks
+        }
+        for future, task_name in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                # One failed baseline should not cancel the others
+                logger.error(f"Baseline task {task_name} failed for {account_id}: {str(e)}")
 
 def enable_cloudtrail(session, account_id):
     """Enable CloudTrail in the account"""
     try:
-        cloudtrail = session.client('cloudtrail')
+        cloudtrail = get_account_client(session, 'cloudtrail')
         
         trail_name = f"aft-baseline-trail-{account_id}"
         
@@ -140,7 +205,7 @@ def enable_cloudtrail(session, account_id):
 def configure_config_service(session, account_id):
     """Configure AWS Config service"""
     try:
-        config = session.client('config')
+        config = get_account_client(session, 'config')
         
         # Create configuration recorder
         config.put_configuration_recorder(
@@ -162,7 +227,7 @@ def configure_config_service(session, account_id):
 def setup_guardduty(session, account_id):
     """Set up GuardDuty"""
     try:
-        guardduty = session.client('guardduty')
+        guardduty = get_account_client(session, 'guardduty')
         
         # Create detector
         response = guardduty.create_detector(
@@ -178,7 +243,7 @@ def setup_guardduty(session, account_id):
 def configure_securityhub(session, account_id):
     """Configure Security Hub"""
     try:
-        securityhub = session.client('securityhub')
+        securityhub = get_account_client(session, 'securityhub')
         
         # Enable Security Hub
         securityhub.enable_security_hub(
@@ -196,8 +261,6 @@ def configure_securityhub(session, account_id):
 def send_notification(account_id, account_name, status, error_message=None):
     """Send SNS notification about AFT processing"""
     try:
-        sns = boto3.client('sns')
-        
         message = {
             'accountId': account_id,
             'accountName': account_name,
@@ -208,7 +271,7 @@ def send_notification(account_id, account_name, status, error_message=None):
         if error_message:
             message['errorMessage'] = error_message
         
-        sns.publish(
+        _SNS.publish(
             TopicArn='${sns_topic_arn}',
             Subject=f'AFT Account Processing - {status}',
             Message=json.dumps(message, indent=2)
@@ -14,14 +14,28 @@ Features:
 """
 
 import argparse
-import boto3
+import csv
+import io
 import json
 import logging
+import operator
 import sys
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
+from functools import cached_property, lru_cache, partial
+
+# Bound once; skips the datetime-module attribute lookup on every timestamp
+_UTC = timezone.utc
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +44,60 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Account IDs resolved via STS, shared across checker instances so that
+# multi-region or repeated scans pay the get_caller_identity round-trip
+# only once per profile/region pair
+_ACCOUNT_ID_CACHE: Dict[Tuple[Optional[str], str], str] = {}
+
+class _TokenBucket:
+    """Client-side token bucket; acquire() blocks until a token is free
+
+    Adaptive retries only react once AWS starts returning throttling
+    errors; proactive pacing keeps the concurrent checks from triggering
+    them in the first place.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# Requests-per-second caps for the chatty services, kept under the AWS
+# side limits (IAM's ~200 RPS is account-wide and shared). Buckets are
+# module-level so every checker instance draws from the same budget.
+_DEFAULT_RPS = {'iam': 180.0, 'ec2': 80.0, 'cloudtrail': 80.0}
+_RATE_BUCKETS: Dict[str, _TokenBucket] = {}
+
+def _dumps(obj: Any) -> str:
+    """Serialize a report payload, preferring orjson when installed
+
+    orjson is a C extension several times faster than the stdlib encoder,
+    which matters once reports carry thousands of results.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+def _parse_report_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse a credential report date field, which may be N/A or absent"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
 class ComplianceStatus(Enum):
     """Compliance status enumeration"""
     COMPLIANT = "COMPLIANT"
@@ -37,7 +105,14 @@ class ComplianceStatus(Enum):
     NOT_APPLICABLE = "NOT_APPLICABLE"
     INSUFFICIENT_DATA = "INSUFFICIENT_DATA"
 
-@dataclass
+# Status-to-string lookup bound once; a dict hit is cheaper than the
+# double attribute access of result.status.value in per-result loops
+_STATUS_STR = {status: status.value for status in ComplianceStatus}
+
+# slots=True drops the per-instance __dict__ (~100 bytes each), which adds
+# up when large accounts produce tens of thousands of results; frozen=True
+# keeps results safe to share across the worker threads
+@dataclass(slots=True, frozen=True)
 class CISControl:
     """CIS control definition"""
     control_id: str
@@ -48,7 +123,7 @@ class CISControl:
     category: str
     automated: bool = True
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComplianceResult:
     """Compliance check result"""
     control_id: str
@@ -61,362 +136,586 @@ class ComplianceResult:
     region: str
     account_id: str
 
+# Field order for serialized results; a single C-level attrgetter pulls
+# all nine attributes per result instead of nine Python-level lookups
+_RESULT_FIELDS = ('control_id', 'status', 'resource_id', 'resource_type',
+                  'reason', 'remediation', 'timestamp', 'region', 'account_id')
+_get_result_fields = operator.attrgetter(*_RESULT_FIELDS)
+
+def _result_entry(result: ComplianceResult) -> Dict[str, Any]:
+    """Serialize one result to a plain dict"""
+    entry = dict(zip(_RESULT_FIELDS, _get_result_fields(result)))
+    entry['status'] = _STATUS_STR[entry['status']]  # Convert enum to string
+    return entry
+
+
+# CIS control definitions, built once at import; CISControl is frozen,
+# so the instances are safely shared by every checker instance instead
+# of being re-allocated per construction
+_CIS_CONTROLS: Dict[str, CISControl] = {
+    # Identity and Access Management (IAM)
+    "1.1": CISControl(
+        control_id="1.1",
+        title="Maintain current contact details",
+        description="Ensure security contact information is up to date",
+        severity="LOW",
+        service="account",
+        category="iam",
+        automated=False
+    ),
+    "1.2": CISControl(
+        control_id="1.2", 
+        title="Ensure security questions are registered",
+        description="Security questions provide additional account protection",
+        severity="LOW",
+        service="account",
+        category="iam",
+        automated=False
+    ),
+    "1.3": CISControl(
+        control_id="1.3",
+        title="Ensure credentials unused for 45 days or greater are disabled",
+        description="Remove or deactivate unnecessary credentials",
+        severity="MEDIUM",
+        service="iam",
+        category="iam"
+    ),
+    "1.4": CISControl(
+        control_id="1.4",
+        title="Ensure access keys are rotated every 90 days or less",
+        description="Regular rotation of access keys reduces exposure risk",
+        severity="MEDIUM", 
+        service="iam",
+        category="iam"
+    ),
+    "1.5": CISControl(
+        control_id="1.5",
+        title="Ensure IAM password policy requires minimum length of 14 or greater",
+        description="Strong password policy enforcement",
+        severity="HIGH",
+        service="iam",
+        category="iam"
+    ),
+    "1.6": CISControl(
+        control_id="1.6",
+        title="Ensure IAM password policy prevents password reuse",
+        description="Prevent users from reusing previous passwords",
+        severity="MEDIUM",
+        service="iam", 
+        category="iam"
+    ),
+    "1.7": CISControl(
+        control_id="1.7",
+        title="Ensure IAM password policy requires uppercase characters",
+        description="Password complexity requirements",
+        severity="MEDIUM",
+        service="iam",
+        category="iam"
+    ),
+    "1.8": CISControl(
+        control_id="1.8",
+        title="Ensure IAM password policy requires lowercase characters", 
+        description="Password complexity requirements",
+        severity="MEDIUM",
+        service="iam",
+        category="iam"
+    ),
+    "1.9": CISControl(
+        control_id="1.9",
+        title="Ensure IAM password policy requires symbols",
+        description="Password complexity requirements",
+        severity="MEDIUM",
+        service="iam",
+        category="iam"
+    ),
+    "1.10": CISControl(
+        control_id="1.10",
+        title="Ensure IAM password policy requires numbers",
+        description="Password complexity requirements", 
+        severity="MEDIUM",
+        service="iam",
+        category="iam"
+    ),
+    "1.11": CISControl(
+        control_id="1.11",
+        title="Ensure IAM password policy requires minimum password age",
+        description="Prevent rapid password changes",
+        severity="LOW",
+        service="iam",
+        category="iam"
+    ),
+    "1.12": CISControl(
+        control_id="1.12",
+        title="Ensure no root user access key exists",
+        description="Root user should not have access keys",
+        severity="CRITICAL",
+        service="iam",
+        category="iam"
+    ),
+    "1.13": CISControl(
+        control_id="1.13", 
+        title="Ensure MFA is enabled for the root user",
+        description="Multi-factor authentication for root account",
+        severity="CRITICAL",
+        service="iam",
+        category="iam"
+    ),
+    "1.14": CISControl(
+        control_id="1.14",
+        title="Ensure hardware MFA is enabled for the root user",
+        description="Hardware-based MFA provides stronger security",
+        severity="HIGH",
+        service="iam",
+        category="iam"
+    ),
+    
+    # Logging (CloudTrail)
+    "3.1": CISControl(
+        control_id="3.1",
+        title="Ensure CloudTrail is enabled in all regions",
+        description="Comprehensive API logging across all regions",
+        severity="HIGH",
+        service="cloudtrail",
+        category="logging"
+    ),
+    "3.2": CISControl(
+        control_id="3.2",
+        title="Ensure CloudTrail log file validation is enabled",
+        description="Detect tampering of CloudTrail logs",
+        severity="MEDIUM",
+        service="cloudtrail", 
+        category="logging"
+    ),
+    "3.3": CISControl(
+        control_id="3.3",
+        title="Ensure the S3 bucket used to store CloudTrail logs is not publicly accessible",
+        description="Protect audit logs from unauthorized access",
+        severity="HIGH",
+        service="s3",
+        category="logging"
+    ),
+    "3.4": CISControl(
+        control_id="3.4",
+        title="Ensure CloudTrail trails are integrated with CloudWatch Logs",
+        description="Enable real-time monitoring of API activity",
+        severity="MEDIUM",
+        service="cloudtrail",
+        category="logging"
+    ),
+    "3.5": CISControl(
+        control_id="3.5",
+        title="Ensure AWS Config is enabled in all regions",
+        description="Configuration compliance monitoring",
+        severity="MEDIUM",
+        service="config",
+        category="logging"
+    ),
+    "3.6": CISControl(
+        control_id="3.6",
+        title="Ensure S3 bucket access logging is enabled on CloudTrail S3 bucket",
+        description="Monitor access to audit log storage",
+        severity="LOW",
+        service="s3",
+        category="logging"
+    ),
+    "3.7": CISControl(
+        control_id="3.7",
+        title="Ensure CloudTrail logs are encrypted at rest using KMS CMKs",
+        description="Protect audit logs with encryption",
+        severity="MEDIUM",
+        service="kms",
+        category="logging"
+    ),
+    "3.8": CISControl(
+        control_id="3.8",
+        title="Ensure rotation for customer-created CMKs is enabled",
+        description="Regular key rotation for enhanced security",
+        severity="MEDIUM",
+        service="kms",
+        category="logging"
+    ),
+    
+    # Networking (VPC)
+    "5.1": CISControl(
+        control_id="5.1",
+        title="Ensure no Network ACLs allow ingress from 0.0.0.0/0 to remote server administration ports",
+        description="Restrict network-level access to management ports",
+        severity="HIGH",
+        service="ec2",
+        category="networking"
+    ),
+    "5.2": CISControl(
+        control_id="5.2", 
+        title="Ensure no security groups allow ingress from 0.0.0.0/0 to remote server administration ports",
+        description="Restrict security group access to management ports",
+        severity="HIGH",
+        service="ec2",
+        category="networking"
+    ),
+    "5.3": CISControl(
+        control_id="5.3",
+        title="Ensure the default security group restricts all traffic",
+        description="Default security groups should deny all traffic",
+        severity="MEDIUM",
+        service="ec2", 
+        category="networking"
+    ),
+    "5.4": CISControl(
+        control_id="5.4",
+        title="Ensure routing tables for VPC peering are least access",
+        description="Minimize routing exposure in peered VPCs",
+        severity="MEDIUM",
+        service="ec2",
+        category="networking"
+    ),
+    "5.5": CISControl(
+        control_id="5.5",
+        title="Ensure VPC flow logging is enabled in all VPCs", 
+        description="Enable network traffic monitoring",
+        severity="MEDIUM",
+        service="ec2",
+        category="networking"
+    ),
+}
+
+
+@lru_cache(maxsize=1)
+def _list_controls_text() -> str:
+    """Render the control catalog for the 'list' command, formatted once."""
+    return "\n".join(
+        f"{control_id}: {control.title}\n"
+        f"  Service: {control.service}\n"
+        f"  Severity: {control.severity}\n"
+        f"  Automated: {control.automated}\n"
+        for control_id, control in _CIS_CONTROLS.items()
+    )
+
+
 class CISBenchmarkChecker:
     """Main CIS benchmark checker class"""
-    
-    def __init__(self, profile: Optional[str] = None, region: str = 'us-east-1'):
+
+    # Remote administration ports for control 5.2 (SSH, RDP, WinRM)
+    ADMIN_PORTS = frozenset({22, 3389, 5985, 5986})
+    ADMIN_MIN = min(ADMIN_PORTS)
+    ADMIN_MAX = max(ADMIN_PORTS)
+    OPEN_CIDR = '0.0.0.0/0'
+
+    def __init__(self, profile: Optional[str] = None, region: str = 'us-east-1',
+                 max_workers: int = 8):
         """
         Initialize the CIS benchmark checker
-        
+
         Args:
             profile: AWS profile to use
             region: AWS region to check
+            max_workers: Concurrent control checks (kept modest to stay
+                under AWS API throttling limits)
         """
+        # boto3 is imported here rather than at module top so credential-free
+        # paths ('list', --help) never pay its ~200ms import cost
+        import boto3
+        from botocore.config import Config
+
         self.profile = profile
         self.region = region
+        self.max_workers = max_workers
         self.session = boto3.Session(profile_name=profile) if profile else boto3.Session()
-        
-        # Initialize AWS clients
-        self.ec2 = self.session.client('ec2', region_name=region)
-        self.iam = self.session.client('iam', region_name=region)
-        self.cloudtrail = self.session.client('cloudtrail', region_name=region)
-        self.config = self.session.client('config', region_name=region)
-        self.security_hub = self.session.client('securityhub', region_name=region)
-        self.s3 = self.session.client('s3', region_name=region)
-        self.kms = self.session.client('kms', region_name=region)
-        self.logs = self.session.client('logs', region_name=region)
-        self.sns = self.session.client('sns', region_name=region)
-        
-        # Get account information
-        sts = self.session.client('sts')
-        self.account_id = sts.get_caller_identity()['Account']
-        
-        logger.info(f"Initialized CIS checker for account {self.account_id} in region {region}")
-        
-        # Define CIS controls
-        self.cis_controls = self._load_cis_controls()
-        
-    def _load_cis_controls(self) -> Dict[str, CISControl]:
-        """Load CIS control definitions"""
-        controls = {
-            # Identity and Access Management (IAM)
-            "1.1": CISControl(
-                control_id="1.1",
-                title="Maintain current contact details",
-                description="Ensure security contact information is up to date",
-                severity="LOW",
-                service="account",
-                category="iam",
-                automated=False
-            ),
-            "1.2": CISControl(
-                control_id="1.2", 
-                title="Ensure security questions are registered",
-                description="Security questions provide additional account protection",
-                severity="LOW",
-                service="account",
-                category="iam",
-                automated=False
-            ),
-            "1.3": CISControl(
-                control_id="1.3",
-                title="Ensure credentials unused for 45 days or greater are disabled",
-                description="Remove or deactivate unnecessary credentials",
-                severity="MEDIUM",
-                service="iam",
-                category="iam"
-            ),
-            "1.4": CISControl(
-                control_id="1.4",
-                title="Ensure access keys are rotated every 90 days or less",
-                description="Regular rotation of access keys reduces exposure risk",
-                severity="MEDIUM", 
-                service="iam",
-                category="iam"
-            ),
-            "1.5": CISControl(
-                control_id="1.5",
-                title="Ensure IAM password policy requires minimum length of 14 or greater",
-                description="Strong password policy enforcement",
-                severity="HIGH",
-                service="iam",
-                category="iam"
-            ),
-            "1.6": CISControl(
-                control_id="1.6",
-                title="Ensure IAM password policy prevents password reuse",
-                description="Prevent users from reusing previous passwords",
-                severity="MEDIUM",
-                service="iam", 
-                category="iam"
-            ),
-            "1.7": CISControl(
-                control_id="1.7",
-                title="Ensure IAM password policy requires uppercase characters",
-                description="Password complexity requirements",
-                severity="MEDIUM",
-                service="iam",
-                category="iam"
-            ),
-            "1.8": CISControl(
-                control_id="1.8",
-                title="Ensure IAM password policy requires lowercase characters", 
-                description="Password complexity requirements",
-                severity="MEDIUM",
-                service="iam",
-                category="iam"
-            ),
-            "1.9": CISControl(
-                control_id="1.9",
-                title="Ensure IAM password policy requires symbols",
-                description="Password complexity requirements",
-                severity="MEDIUM",
-                service="iam",
-                category="iam"
-            ),
-            "1.10": CISControl(
-                control_id="1.10",
-                title="Ensure IAM password policy requires numbers",
-                description="Password complexity requirements", 
-                severity="MEDIUM",
-                service="iam",
-                category="iam"
-            ),
-            "1.11": CISControl(
-                control_id="1.11",
-                title="Ensure IAM password policy requires minimum password age",
-                description="Prevent rapid password changes",
-                severity="LOW",
-                service="iam",
-                category="iam"
-            ),
-            "1.12": CISControl(
-                control_id="1.12",
-                title="Ensure no root user access key exists",
-                description="Root user should not have access keys",
-                severity="CRITICAL",
-                service="iam",
-                category="iam"
-            ),
-            "1.13": CISControl(
-                control_id="1.13", 
-                title="Ensure MFA is enabled for the root user",
-                description="Multi-factor authentication for root account",
-                severity="CRITICAL",
-                service="iam",
-                category="iam"
-            ),
-            "1.14": CISControl(
-                control_id="1.14",
-                title="Ensure hardware MFA is enabled for the root user",
-                description="Hardware-based MFA provides stronger security",
-                severity="HIGH",
-                service="iam",
-                category="iam"
-            ),
-            
-            # Logging (CloudTrail)
-            "3.1": CISControl(
-                control_id="3.1",
-                title="Ensure CloudTrail is enabled in all regions",
-                description="Comprehensive API logging across all regions",
-                severity="HIGH",
-                service="cloudtrail",
-                category="logging"
-            ),
-            "3.2": CISControl(
-                control_id="3.2",
-                title="Ensure CloudTrail log file validation is enabled",
-                description="Detect tampering of CloudTrail logs",
-                severity="MEDIUM",
-                service="cloudtrail", 
-                category="logging"
-            ),
-            "3.3": CISControl(
-                control_id="3.3",
-                title="Ensure the S3 bucket used to store CloudTrail logs is not publicly accessible",
-                description="Protect audit logs from unauthorized access",
-                severity="HIGH",
-                service="s3",
-                category="logging"
-            ),
-            "3.4": CISControl(
-                control_id="3.4",
-                title="Ensure CloudTrail trails are integrated with CloudWatch Logs",
-                description="Enable real-time monitoring of API activity",
-                severity="MEDIUM",
-                service="cloudtrail",
-                category="logging"
-            ),
-            "3.5": CISControl(
-                control_id="3.5",
-                title="Ensure AWS Config is enabled in all regions",
-                description="Configuration compliance monitoring",
-                severity="MEDIUM",
-                service="config",
-                category="logging"
-            ),
-            "3.6": CISControl(
-                control_id="3.6",
-                title="Ensure S3 bucket access logging is enabled on CloudTrail S3 bucket",
-                description="Monitor access to audit log storage",
-                severity="LOW",
-                service="s3",
-                category="logging"
-            ),
-            "3.7": CISControl(
-                control_id="3.7",
-                title="Ensure CloudTrail logs are encrypted at rest using KMS CMKs",
-                description="Protect audit logs with encryption",
-                severity="MEDIUM",
-                service="kms",
-                category="logging"
-            ),
-            "3.8": CISControl(
-                control_id="3.8",
-                title="Ensure rotation for customer-created CMKs is enabled",
-                description="Regular key rotation for enhanced security",
-                severity="MEDIUM",
-                service="kms",
-                category="logging"
-            ),
-            
-            # Networking (VPC)
-            "5.1": CISControl(
-                control_id="5.1",
-                title="Ensure no Network ACLs allow ingress from 0.0.0.0/0 to remote server administration ports",
-                description="Restrict network-level access to management ports",
-                severity="HIGH",
-                service="ec2",
-                category="networking"
-            ),
-            "5.2": CISControl(
-                control_id="5.2", 
-                title="Ensure no security groups allow ingress from 0.0.0.0/0 to remote server administration ports",
-                description="Restrict security group access to management ports",
-                severity="HIGH",
-                service="ec2",
-                category="networking"
-            ),
-            "5.3": CISControl(
-                control_id="5.3",
-                title="Ensure the default security group restricts all traffic",
-                description="Default security groups should deny all traffic",
-                severity="MEDIUM",
-                service="ec2", 
-                category="networking"
-            ),
-            "5.4": CISControl(
-                control_id="5.4",
-                title="Ensure routing tables for VPC peering are least access",
-                description="Minimize routing exposure in peered VPCs",
-                severity="MEDIUM",
-                service="ec2",
-                category="networking"
-            ),
-            "5.5": CISControl(
-                control_id="5.5",
-                title="Ensure VPC flow logging is enabled in all VPCs", 
-                description="Enable network traffic monitoring",
-                severity="MEDIUM",
-                service="ec2",
-                category="networking"
-            ),
+
+        # Client *creation* on a shared Session is not thread-safe, and the
+        # lazy clients are first touched from the check worker threads
+        self._client_lock = threading.Lock()
+
+        # Shared client config: adaptive retries rate-limit client-side
+        # instead of failing on ThrottlingException when checks run
+        # concurrently, the larger pool reuses TCP/TLS connections across
+        # paginated calls rather than re-handshaking, and keepalive stops
+        # idle pooled connections being torn down between call bursts
+        self._client_config = Config(
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            max_pool_connections=50,
+            tcp_keepalive=True
+        )
+
+        logger.info("Initialized CIS checker for region %s", region)
+
+        # CIS controls are defined once at module scope
+        self.cis_controls = _CIS_CONTROLS
+
+        # Map control IDs to check methods once; run_check used to rebuild
+        # this dict (and its bound methods) on every call
+        self._check_methods = {
+            "1.3": self.check_control_1_3,
+            "1.12": self.check_control_1_12,
+            "3.1": self.check_control_3_1,
+            "5.2": self.check_control_5_2,
         }
-        
-        return controls
+
+    def _session_client(self, service_name: str):
+        """Build a service client with the shared config and rate pacing
+
+        Serialized on _client_lock: concurrent session.client() calls on
+        one Session race on shared loader state, and the worker threads
+        all construct their clients on first use.
+        """
+        with self._client_lock:
+            client = self.session.client(service_name, region_name=self.region,
+                                         config=self._client_config)
+        rate = _DEFAULT_RPS.get(service_name)
+        if rate is not None:
+            bucket = _RATE_BUCKETS.setdefault(service_name, _TokenBucket(rate))
+            client.meta.events.register(
+                f'before-send.{service_name}.*',
+                lambda request, **kwargs: bucket.acquire()
+            )
+        return client
+
+    # Clients are built lazily on first use: each construction parses the
+    # service JSON model and builds an endpoint resolver, and most runs
+    # only touch a subset of services (a 1.12-only check needs just IAM)
+
+    @cached_property
+    def ec2(self):
+        return self._session_client('ec2')
+
+    @cached_property
+    def iam(self):
+        return self._session_client('iam')
+
+    @cached_property
+    def cloudtrail(self):
+        return self._session_client('cloudtrail')
+
+    @cached_property
+    def config(self):
+        return self._session_client('config')
+
+    @cached_property
+    def security_hub(self):
+        return self._session_client('securityhub')
+
+    @cached_property
+    def s3(self):
+        return self._session_client('s3')
+
+    @cached_property
+    def kms(self):
+        return self._session_client('kms')
+
+    @cached_property
+    def logs(self):
+        return self._session_client('logs')
+
+    @cached_property
+    def sns(self):
+        return self._session_client('sns')
+
+    @cached_property
+    def account_id(self) -> str:
+        """Caller's account ID, fetched from STS on first use"""
+        cache_key = (self.profile, self.region)
+        account_id = _ACCOUNT_ID_CACHE.get(cache_key)
+        if account_id is None:
+            account_id = self._session_client('sts').get_caller_identity()['Account']
+            _ACCOUNT_ID_CACHE[cache_key] = account_id
+        return account_id
 
     def check_control_1_3(self) -> List[ComplianceResult]:
         """1.3 - Ensure credentials unused for 45 days or greater are disabled"""
         results = []
-        
+        now = datetime.now(_UTC)
+        now_iso = now.isoformat()
+        mk = partial(ComplianceResult, timestamp=now_iso,
+                     region=self.region, account_id=self.account_id)
+
+        # The credential report covers every user's password and access key
+        # usage in a single call, versus one list_access_keys plus one
+        # get_access_key_last_used round-trip per user on the fallback path
+        try:
+            return self._check_1_3_from_credential_report(now, now_iso)
+        except Exception as e:
+            logger.warning("Credential report unavailable (%s), falling back to per-user API calls", e)
+
         try:
-            # Check IAM users
+            # The per-user API calls are independent network round-trips,
+            # so fan each page of users out over a thread pool; the shared
+            # IAM client is thread-safe and adaptive retries back the
+            # workers off if IAM starts throttling
             paginator = self.iam.get_paginator('list_users')
-            for page in paginator.paginate():
-                for user in page['Users']:
-                    username = user['UserName']
-                    
-                    # Check password last used
-                    if 'PasswordLastUsed' in user:
-                        last_used = user['PasswordLastUsed']
-                        days_since_used = (datetime.now(timezone.utc) - last_used).days
-                        
-                        if days_since_used > 45:
-                            results.append(ComplianceResult(
-                                control_id="1.3",
-                                status=ComplianceStatus.NON_COMPLIANT,
-                                resource_id=username,
-                                resource_type="IAM::User",
-                                reason=f"Password unused for {days_since_used} days",
-                                remediation="Disable or remove the user account",
-                                timestamp=datetime.now(timezone.utc).isoformat(),
-                                region=self.region,
-                                account_id=self.account_id
-                            ))
-                        else:
-                            results.append(ComplianceResult(
-                                control_id="1.3",
-                                status=ComplianceStatus.COMPLIANT,
-                                resource_id=username,
-                                resource_type="IAM::User",
-                                reason=f"Password used within {days_since_used} days",
-                                remediation="No action needed",
-                                timestamp=datetime.now(timezone.utc).isoformat(),
-                                region=self.region,
-                                account_id=self.account_id
-                            ))
-                    
-                    # Check access keys
-                    try:
-                        keys_response = self.iam.list_access_keys(UserName=username)
-                        for key in keys_response['AccessKeyMetadata']:
-                            key_id = key['AccessKeyId']
-                            
-                            # Get last used information
-                            try:
-                                last_used_response = self.iam.get_access_key_last_used(AccessKeyId=key_id)
-                                if 'LastUsedDate' in last_used_response['AccessKeyLastUsed']:
-                                    last_used = last_used_response['AccessKeyLastUsed']['LastUsedDate']
-                                    days_since_used = (datetime.now(timezone.utc) - last_used).days
-                                    
-                                    if days_since_used > 45:
-                                        results.append(ComplianceResult(
-                                            control_id="1.3",
-                                            status=ComplianceStatus.NON_COMPLIANT,
-                                            resource_id=key_id,
-                                            resource_type="IAM::AccessKey",
-                                            reason=f"Access key unused for {days_since_used} days",
-                                            remediation="Disable or delete the access key",
-                                            timestamp=datetime.now(timezone.utc).isoformat(),
-                                            region=self.region,
-                                            account_id=self.account_id
-                                        ))
-                            except Exception as e:
-                                logger.warning(f"Could not check last used for key {key_id}: {e}")
-                                
-                    except Exception as e:
-                        logger.warning(f"Could not check access keys for user {username}: {e}")
-                        
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                for page in paginator.paginate():
+                    for user_results in executor.map(
+                            lambda user: self._check_user_credentials(user, now, now_iso),
+                            page['Users']):
+                        results.extend(user_results)
+
         except Exception as e:
-            logger.error(f"Error checking control 1.3: {e}")
-            results.append(ComplianceResult(
+            logger.error("Error checking control 1.3: %s", e)
+            results.append(mk(
                 control_id="1.3",
                 status=ComplianceStatus.INSUFFICIENT_DATA,
                 resource_id="N/A",
                 resource_type="IAM",
                 reason=f"Error during check: {e}",
                 remediation="Review IAM permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
             ))
             
         return results
 
+    def _check_user_credentials(self, user: Dict[str, Any], now: datetime,
+                                now_iso: str) -> List[ComplianceResult]:
+        """Evaluate one user's password and access keys for control 1.3"""
+        username = user['UserName']
+        results = []
+        mk = partial(ComplianceResult, timestamp=now_iso,
+                     region=self.region, account_id=self.account_id)
+
+        # Check password last used
+        if 'PasswordLastUsed' in user:
+            last_used = user['PasswordLastUsed']
+            days_since_used = (now - last_used).days
+
+            if days_since_used > 45:
+                results.append(mk(
+                    control_id="1.3",
+                    status=ComplianceStatus.NON_COMPLIANT,
+                    resource_id=username,
+                    resource_type="IAM::User",
+                    reason=f"Password unused for {days_since_used} days",
+                    remediation="Disable or remove the user account",
+                ))
+            else:
+                results.append(mk(
+                    control_id="1.3",
+                    status=ComplianceStatus.COMPLIANT,
+                    resource_id=username,
+                    resource_type="IAM::User",
+                    reason=f"Password used within {days_since_used} days",
+                    remediation="No action needed",
+                ))
+
+        # Check access keys
+        try:
+            keys_response = self.iam.list_access_keys(UserName=username)
+            for key in keys_response['AccessKeyMetadata']:
+                key_id = key['AccessKeyId']
+
+                # Get last used information
+                try:
+                    last_used_response = self.iam.get_access_key_last_used(AccessKeyId=key_id)
+                    if 'LastUsedDate' in last_used_response['AccessKeyLastUsed']:
+                        last_used = last_used_response['AccessKeyLastUsed']['LastUsedDate']
+                        days_since_used = (now - last_used).days
+
+                        if days_since_used > 45:
+                            results.append(mk(
+                                control_id="1.3",
+                                status=ComplianceStatus.NON_COMPLIANT,
+                                resource_id=key_id,
+                                resource_type="IAM::AccessKey",
+                                reason=f"Access key unused for {days_since_used} days",
+                                remediation="Disable or delete the access key",
+                            ))
+                except Exception as e:
+                    logger.warning("Could not check last used for key %s: %s", key_id, e)
+
+        except Exception as e:
+            logger.warning("Could not check access keys for user %s: %s", username, e)
+
+        return results
+
+    def _check_1_3_from_credential_report(self, now: datetime,
+                                          now_iso: str) -> List[ComplianceResult]:
+        """Evaluate control 1.3 from the IAM credential report
+
+        One generate/get pair replaces O(users) API calls; the report CSV
+        already includes password and per-key last-used dates for all users.
+        """
+        # Generation is async; poll until the report is ready
+        for _ in range(15):
+            state = self.iam.generate_credential_report()['State']
+            if state == 'COMPLETE':
+                break
+            time.sleep(1)
+        else:
+            raise TimeoutError("credential report generation did not complete")
+
+        content = self.iam.get_credential_report()['Content'].decode('utf-8')
+        results = []
+        mk = partial(ComplianceResult, timestamp=now_iso,
+                     region=self.region, account_id=self.account_id)
+
+        rows = [row for row in csv.DictReader(io.StringIO(content))
+                if row['user'] != '<root_account>']
+        # Root credentials are covered by controls 1.12-1.14
+
+        # Fast path: when no user has a console password or an active key
+        # there is nothing to age-check, so emit one aggregate record
+        # instead of allocating per-user results
+        if all(row.get('password_enabled') != 'true'
+               and row.get('access_key_1_active') != 'true'
+               and row.get('access_key_2_active') != 'true'
+               for row in rows):
+            return [mk(
+                control_id="1.3",
+                status=ComplianceStatus.COMPLIANT,
+                resource_id="<account>",
+                resource_type="IAM",
+                reason=f"None of the {len(rows)} users have console passwords or active access keys",
+                remediation="No action needed",
+            )]
+
+        for row in rows:
+            username = row['user']
+
+            if row.get('password_enabled') == 'true':
+                last_used = _parse_report_date(row.get('password_last_used'))
+                if last_used is not None:
+                    days_since_used = (now - last_used).days
+                    if days_since_used > 45:
+                        results.append(mk(
+                            control_id="1.3",
+                            status=ComplianceStatus.NON_COMPLIANT,
+                            resource_id=username,
+                            resource_type="IAM::User",
+                            reason=f"Password unused for {days_since_used} days",
+                            remediation="Disable or remove the user account",
+                        ))
+                    else:
+                        results.append(mk(
+                            control_id="1.3",
+                            status=ComplianceStatus.COMPLIANT,
+                            resource_id=username,
+                            resource_type="IAM::User",
+                            reason=f"Password used within {days_since_used} days",
+                            remediation="No action needed",
+                        ))
+
+            for slot in ('1', '2'):
+                if row.get(f'access_key_{slot}_active') != 'true':
+                    continue
+                last_used = _parse_report_date(row.get(f'access_key_{slot}_last_used_date'))
+                if last_used is None:
+                    continue
+                days_since_used = (now - last_used).days
+                if days_since_used > 45:
+                    results.append(mk(
+                        control_id="1.3",
+                        status=ComplianceStatus.NON_COMPLIANT,
+                        resource_id=f"{username}/access-key-{slot}",
+                        resource_type="IAM::AccessKey",
+                        reason=f"Access key unused for {days_since_used} days",
+                        remediation="Disable or delete the access key",
+                    ))
+
+        return results
+
     def check_control_1_12(self) -> List[ComplianceResult]:
         """1.12 - Ensure no root user access key exists"""
         results = []
+        now = datetime.now(_UTC)
+        now_iso = now.isoformat()
+        mk = partial(ComplianceResult, timestamp=now_iso,
+                     region=self.region, account_id=self.account_id)
         
         try:
             # Get account summary to check root access keys
@@ -424,42 +723,33 @@ class CISBenchmarkChecker:
             root_access_keys = summary['SummaryMap'].get('AccountAccessKeysPresent', 0)
             
             if root_access_keys > 0:
-                results.append(ComplianceResult(
+                results.append(mk(
                     control_id="1.12",
                     status=ComplianceStatus.NON_COMPLIANT,
                     resource_id="root",
                     resource_type="IAM::Root",
                     reason="Root user has access keys",
                     remediation="Delete root user access keys immediately",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
                 ))
             else:
-                results.append(ComplianceResult(
+                results.append(mk(
                     control_id="1.12",
                     status=ComplianceStatus.COMPLIANT,
                     resource_id="root",
                     resource_type="IAM::Root",
                     reason="No root user access keys found",
                     remediation="No action needed",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
                 ))
                 
         except Exception as e:
-            logger.error(f"Error checking control 1.12: {e}")
-            results.append(ComplianceResult(
+            logger.error("Error checking control 1.12: %s", e)
+            results.append(mk(
                 control_id="1.12",
                 status=ComplianceStatus.INSUFFICIENT_DATA,
                 resource_id="root",
                 resource_type="IAM::Root",
                 reason=f"Error during check: {e}",
                 remediation="Review IAM permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
             ))
             
         return results
@@ -467,301 +757,406 @@ class CISBenchmarkChecker:
     def check_control_3_1(self) -> List[ComplianceResult]:
         """3.1 - Ensure CloudTrail is enabled in all regions"""
         results = []
+        now = datetime.now(_UTC)
+        now_iso = now.isoformat()
+        mk = partial(ComplianceResult, timestamp=now_iso,
+                     region=self.region, account_id=self.account_id)
         
         try:
-            # Check if CloudTrail is enabled
-            trails = self.cloudtrail.describe_trails()['trailList']
-            
+            # Check if CloudTrail is enabled; shadow trails are cross-region
+            # duplicates of trails already in the list, so skip them
+            trails = self.cloudtrail.describe_trails(IncludeShadowTrails=False)['trailList']
+
             # Check for multi-region trail
             multi_region_trails = [t for t in trails if t.get('IsMultiRegionTrail', False)]
-            
+
             if multi_region_trails:
-                for trail in multi_region_trails:
-                    # Check if trail is logging
-                    status = self.cloudtrail.get_trail_status(Name=trail['TrailARN'])
-                    
+                # Status lookups are independent, so fetch them concurrently
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    statuses = list(executor.map(
+                        lambda t: self.cloudtrail.get_trail_status(Name=t['TrailARN']),
+                        multi_region_trails))
+
+                for trail, status in zip(multi_region_trails, statuses):
                     if status['IsLogging']:
-                        results.append(ComplianceResult(
+                        results.append(mk(
                             control_id="3.1",
                             status=ComplianceStatus.COMPLIANT,
                             resource_id=trail['Name'],
                             resource_type="CloudTrail::Trail",
                             reason="Multi-region trail is active and logging",
                             remediation="No action needed",
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            region=self.region,
-                            account_id=self.account_id
                         ))
                     else:
-                        results.append(ComplianceResult(
+                        results.append(mk(
                             control_id="3.1",
                             status=ComplianceStatus.NON_COMPLIANT,
                             resource_id=trail['Name'],
                             resource_type="CloudTrail::Trail",
                             reason="Multi-region trail exists but is not logging",
                             remediation="Start CloudTrail logging",
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            region=self.region,
-                            account_id=self.account_id
                         ))
             else:
-                results.append(ComplianceResult(
+                results.append(mk(
                     control_id="3.1",
                     status=ComplianceStatus.NON_COMPLIANT,
                     resource_id="N/A",
                     resource_type="CloudTrail",
                     reason="No multi-region CloudTrail found",
                     remediation="Create and enable a multi-region CloudTrail",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
                 ))
                 
         except Exception as e:
-            logger.error(f"Error checking control 3.1: {e}")
-            results.append(ComplianceResult(
+            logger.error("Error checking control 3.1: %s", e)
+            results.append(mk(
                 control_id="3.1",
                 status=ComplianceStatus.INSUFFICIENT_DATA,
                 resource_id="N/A",
                 resource_type="CloudTrail",
                 reason=f"Error during check: {e}",
                 remediation="Review CloudTrail permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
             ))
             
         return results
 
+    def _rule_opens_admin_ports(self, rule: Dict[str, Any]) -> bool:
+        """True if an ingress rule exposes an admin port to 0.0.0.0/0"""
+        ip_protocol = rule.get('IpProtocol')
+        if ip_protocol == 'tcp':
+            from_port = rule.get('FromPort')
+            to_port = rule.get('ToPort')
+            if from_port is None or to_port is None:
+                return False
+            # Cheap range-overlap rejection before touching IpRanges
+            if to_port < self.ADMIN_MIN or from_port > self.ADMIN_MAX:
+                return False
+            # A range spanning the full admin span necessarily covers one;
+            # otherwise test the four ports directly
+            if not (from_port <= self.ADMIN_MIN and to_port >= self.ADMIN_MAX):
+                if not any(from_port <= port <= to_port for port in self.ADMIN_PORTS):
+                    return False
+        elif ip_protocol != '-1':  # -1 means all protocols
+            return False
+
+        return any(ip_range.get('CidrIp') == self.OPEN_CIDR
+                   for ip_range in rule.get('IpRanges', ()))
+
+    def _sg_result(self, status: ComplianceStatus, resource_id: str,
+                   reason: str, remediation: str, now_iso: str) -> ComplianceResult:
+        """Build a control 5.2 result without repeating the boilerplate"""
+        return ComplianceResult(
+            control_id="5.2",
+            status=status,
+            resource_id=resource_id,
+            resource_type="EC2::SecurityGroup",
+            reason=reason,
+            remediation=remediation,
+            timestamp=now_iso,
+            region=self.region,
+            account_id=self.account_id
+        )
+
     def check_control_5_2(self) -> List[ComplianceResult]:
         """5.2 - Ensure no security groups allow ingress from 0.0.0.0/0 to remote server administration ports"""
         results = []
-        admin_ports = [22, 3389, 5985, 5986]  # SSH, RDP, WinRM
-        
+        now = datetime.now(_UTC)
+        now_iso = now.isoformat()
+
         try:
             paginator = self.ec2.get_paginator('describe_security_groups')
+
+            # Server-side filter: only groups with a 0.0.0.0/0 ingress rule
+            # can possibly be non-compliant, so let EC2 return just those
+            # instead of shipping every internal-only group over the wire
+            non_compliant_ids = set()
+            for page in paginator.paginate(
+                    Filters=[{'Name': 'ip-permission.cidr',
+                              'Values': [self.OPEN_CIDR]}]):
+                for sg in page['SecurityGroups']:
+                    # Only report once per security group
+                    if any(self._rule_opens_admin_ports(rule)
+                           for rule in sg.get('IpPermissions', [])):
+                        non_compliant_ids.add(sg['GroupId'])
+                        results.append(self._sg_result(
+                            ComplianceStatus.NON_COMPLIANT, sg['GroupId'],
+                            "Allows admin ports from 0.0.0.0/0",
+                            "Restrict source IPs to specific networks",
+                            now_iso))
+
+            # Every group not flagged above is compliant. One aggregated
+            # record keeps the report O(non-compliant) instead of carrying
+            # thousands of identical COMPLIANT entries on large accounts
+            compliant_count = 0
             for page in paginator.paginate():
                 for sg in page['SecurityGroups']:
-                    sg_id = sg['GroupId']
-                    
-                    # Check each ingress rule
-                    for rule in sg.get('IpPermissions', []):
-                        # Check if rule allows admin ports from 0.0.0.0/0
-                        from_port = rule.get('FromPort')
-                        to_port = rule.get('ToPort')
-                        ip_protocol = rule.get('IpProtocol')
-                        
-                        # Check for admin ports
-                        risky_rule = False
-                        if ip_protocol == 'tcp':
-                            if from_port and to_port:
-                                # Check if any admin port is in range
-                                for admin_port in admin_ports:
-                                    if from_port <= admin_port <= to_port:
-                                        # Check if 0.0.0.0/0 is allowed
-                                        for ip_range in rule.get('IpRanges', []):
-                                            if ip_range.get('CidrIp') == '0.0.0.0/0':
-                                                risky_rule = True
-                                                break
-                        elif ip_protocol == '-1':  # All protocols
-                            for ip_range in rule.get('IpRanges', []):
-                                if ip_range.get('CidrIp') == '0.0.0.0/0':
-                                    risky_rule = True
-                                    break
-                        
-                        if risky_rule:
-                            results.append(ComplianceResult(
-                                control_id="5.2",
-                                status=ComplianceStatus.NON_COMPLIANT,
-                                resource_id=sg_id,
-                                resource_type="EC2::SecurityGroup",
-                                reason=f"Allows admin ports from 0.0.0.0/0",
-                                remediation="Restrict source IPs to specific networks",
-                                timestamp=datetime.now(timezone.utc).isoformat(),
-                                region=self.region,
-                                account_id=self.account_id
-                            ))
-                            break  # Only report once per security group
-                    else:
-                        # No risky rules found for this security group
-                        results.append(ComplianceResult(
-                            control_id="5.2",
-                            status=ComplianceStatus.COMPLIANT,
-                            resource_id=sg_id,
-                            resource_type="EC2::SecurityGroup",
-                            reason="No admin ports open to 0.0.0.0/0",
-                            remediation="No action needed",
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            region=self.region,
-                            account_id=self.account_id
-                        ))
-                        
+                    if sg['GroupId'] not in non_compliant_ids:
+                        compliant_count += 1
+
+            results.append(self._sg_result(
+                ComplianceStatus.COMPLIANT, "<summary>",
+                f"{compliant_count} security groups have no admin ports open to 0.0.0.0/0",
+                "No action needed",
+                now_iso))
+
         except Exception as e:
-            logger.error(f"Error checking control 5.2: {e}")
-            results.append(ComplianceResult(
-                control_id="5.2",
-                status=ComplianceStatus.INSUFFICIENT_DATA,
-                resource_id="N/A",
-                resource_type="EC2::SecurityGroup",
-                reason=f"Error during check: {e}",
-                remediation="Review EC2 permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
-            ))
-            
+            logger.error("Error checking control 5.2: %s", e)
+            results.append(self._sg_result(
+                ComplianceStatus.INSUFFICIENT_DATA, "N/A",
+                f"Error during check: {e}",
+                "Review EC2 permissions and retry",
+                now_iso))
+
         return results
 
     def run_check(self, control_ids: Optional[List[str]] = None) -> List[ComplianceResult]:
         """
         Run CIS benchmark checks
-        
+
         Args:
             control_ids: Specific control IDs to check (if None, check all)
-            
+
         Returns:
             List of compliance results
         """
+        return list(self._iter_results(control_ids))
+
+    @classmethod
+    def run_multi(cls, profiles: List[Optional[str]], regions: List[str],
+                  control_ids: Optional[List[str]] = None,
+                  max_parallel_accounts: int = 8
+                  ) -> Dict[Tuple[Optional[str], str], List[ComplianceResult]]:
+        """
+        Run checks across several profiles and regions concurrently
+
+        Args:
+            profiles: AWS profiles to scan (None means default credentials)
+            regions: Regions to scan per profile
+            control_ids: Specific control IDs to check (if None, check all)
+            max_parallel_accounts: Concurrent (profile, region) scans; kept
+                modest so the per-account pools don't collectively hammer
+                the shared control-plane limits
+
+        Returns:
+            Mapping of (profile, region) to that scan's compliance results
+        """
+        def _run_one(profile, region):
+            return cls(profile=profile, region=region).run_check(control_ids)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_parallel_accounts) as executor:
+            futures = {
+                executor.submit(_run_one, profile, region): (profile, region)
+                for profile in profiles
+                for region in regions
+            }
+            for future in as_completed(futures):
+                profile, region = futures[future]
+                try:
+                    results[(profile, region)] = future.result()
+                except Exception as e:
+                    logger.error("Scan failed for profile=%s region=%s: %s", profile, region, e)
+                    results[(profile, region)] = []
+
+        return results
+
+    def _iter_results(self, control_ids: Optional[List[str]] = None):
+        """Run CIS benchmark checks, yielding results as they arrive
+
+        Streaming lets generate_report consume results without a second
+        O(N) list being held alongside the report payload.
+        """
         if control_ids is None:
             control_ids = list(self.cis_controls.keys())
-            
-        all_results = []
-        
+
+        now_iso = datetime.now(_UTC).isoformat()
+        mk = partial(ComplianceResult, timestamp=now_iso,
+                     region=self.region, account_id=self.account_id)
+
+        check_methods = self._check_methods
+
+        implemented = []
         for control_id in control_ids:
             if control_id not in self.cis_controls:
-                logger.warning(f"Unknown control ID: {control_id}")
+                logger.warning("Unknown control ID: %s", control_id)
                 continue
-                
-            logger.info(f"Checking control {control_id}: {self.cis_controls[control_id].title}")
-            
-            # Map control IDs to check methods
-            check_methods = {
-                "1.3": self.check_control_1_3,
-                "1.12": self.check_control_1_12,
-                "3.1": self.check_control_3_1,
-                "5.2": self.check_control_5_2,
-            }
-            
+
+            logger.info("Checking control %s: %s", control_id, self.cis_controls[control_id].title)
+
             if control_id in check_methods:
-                try:
-                    results = check_methods[control_id]()
-                    all_results.extend(results)
-                except Exception as e:
-                    logger.error(f"Error checking control {control_id}: {e}")
-                    all_results.append(ComplianceResult(
-                        control_id=control_id,
-                        status=ComplianceStatus.INSUFFICIENT_DATA,
-                        resource_id="N/A",
-                        resource_type="Unknown",
-                        reason=f"Check method failed: {e}",
-                        remediation="Review implementation and retry",
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        region=self.region,
-                        account_id=self.account_id
-                    ))
+                implemented.append(control_id)
             else:
-                logger.warning(f"Check method not implemented for control {control_id}")
-                all_results.append(ComplianceResult(
+                logger.warning("Check method not implemented for control %s", control_id)
+                yield mk(
                     control_id=control_id,
                     status=ComplianceStatus.NOT_APPLICABLE,
                     resource_id="N/A",
                     resource_type="Unknown",
                     reason="Check method not implemented",
                     remediation="Manual review required",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
-                ))
-                
-        return all_results
+                )
+
+        if implemented:
+            # Each implemented control blocks on independent AWS APIs, so
+            # run them concurrently; wall time becomes the slowest check
+            # instead of the sum of all of them
+            workers = min(self.max_workers, len(implemented))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(check_methods[control_id]): control_id
+                    for control_id in implemented
+                }
+                for future in as_completed(futures):
+                    control_id = futures[future]
+                    try:
+                        yield from future.result()
+                    except Exception as e:
+                        logger.error("Error checking control %s: %s", control_id, e)
+                        yield mk(
+                            control_id=control_id,
+                            status=ComplianceStatus.INSUFFICIENT_DATA,
+                            resource_id="N/A",
+                            resource_type="Unknown",
+                            reason=f"Check method failed: {e}",
+                            remediation="Review implementation and retry",
+                        )
 
-    def generate_report(self, results: List[ComplianceResult], output_format: str = 'json') -> str:
+    def iter_report_chunks(self, results, output_format: str = 'json'):
+        """Yield report fragments so large reports never exist as one string
+
+        The JSON path emits the results array first, one encoded record at
+        a time, then the metadata and summary (whose counts are only known
+        after the last result); key order is irrelevant to JSON consumers.
+        Memory is bounded by a single record instead of the whole report.
+        """
+        if output_format != 'json':
+            # The text format is header-first and already cheap to build
+            yield self.generate_report(results, output_format)
+            return
+
+        counts = {status: 0 for status in ComplianceStatus}
+
+        yield '{\n"results": ['
+        first = True
+        for result in results:
+            counts[result.status] += 1
+            yield ('\n' if first else ',\n') + _dumps(_result_entry(result))
+            first = False
+
+        tail = {
+            "report_metadata": {
+                "timestamp": datetime.now(_UTC).isoformat(),
+                "account_id": self.account_id,
+                "region": self.region,
+                "total_checks": sum(counts.values())
+            },
+            "summary": {
+                "compliant": counts[ComplianceStatus.COMPLIANT],
+                "non_compliant": counts[ComplianceStatus.NON_COMPLIANT],
+                "not_applicable": counts[ComplianceStatus.NOT_APPLICABLE],
+                "insufficient_data": counts[ComplianceStatus.INSUFFICIENT_DATA]
+            }
+        }
+        # Close the array and splice the tail object's body in after it
+        yield '\n],' + _dumps(tail)[1:]
+
+    def generate_report(self, results, output_format: str = 'json') -> str:
         """
         Generate compliance report
-        
+
         Args:
-            results: Compliance check results
+            results: Compliance check results (any iterable, including the
+                generator from _iter_results)
             output_format: Output format ('json' or 'text')
-            
+
         Returns:
             Formatted report string
         """
-        if output_format == 'json':
-            report_data = {
-                "report_metadata": {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "account_id": self.account_id,
-                    "region": self.region,
-                    "total_checks": len(results)
-                },
-                "summary": {
-                    "compliant": len([r for r in results if r.status == ComplianceStatus.COMPLIANT]),
-                    "non_compliant": len([r for r in results if r.status == ComplianceStatus.NON_COMPLIANT]),
-                    "not_applicable": len([r for r in results if r.status == ComplianceStatus.NOT_APPLICABLE]),
-                    "insufficient_data": len([r for r in results if r.status == ComplianceStatus.INSUFFICIENT_DATA])
-                },
-                "results": [
-                    {
-                        "control_id": result.control_id,
-                        "status": result.status.value,  # Convert enum to string
-                        "resource_id": result.resource_id,
-                        "resource_type": result.resource_type,
-                        "reason": result.reason,
-                        "remediation": result.remediation,
-                        "timestamp": result.timestamp,
-                        "region": result.region,
-                        "account_id": result.account_id
-                    }
-                    for result in results
-                ]
-            }
-            return json.dumps(report_data, indent=2)
-        else:
-            # Text format
-            report_lines = [
-                "=" * 80,
-                "AWS CIS Benchmark Compliance Report",
-                "=" * 80,
-                f"Timestamp: {datetime.now(timezone.utc).isoformat()}",
-                f"Account ID: {self.account_id}",
-                f"Region: {self.region}",
-                f"Total Checks: {len(results)}",
-                "",
-                "SUMMARY",
-                "-" * 40,
-            ]
-            
-            summary = {
-                "Compliant": len([r for r in results if r.status == ComplianceStatus.COMPLIANT]),
-                "Non-Compliant": len([r for r in results if r.status == ComplianceStatus.NON_COMPLIANT]),
-                "Not Applicable": len([r for r in results if r.status == ComplianceStatus.NOT_APPLICABLE]),
-                "Insufficient Data": len([r for r in results if r.status == ComplianceStatus.INSUFFICIENT_DATA])
-            }
-            
-            for status, count in summary.items():
-                report_lines.append(f"{status}: {count}")
-            
-            report_lines.extend(["", "DETAILED RESULTS", "-" * 40])
-            
-            for result in results:
-                report_lines.extend([
-                    f"Control: {result.control_id}",
-                    f"Status: {result.status.value}",
-                    f"Resource: {result.resource_type}::{result.resource_id}",
-                    f"Reason: {result.reason}",
-                    f"Remediation: {result.remediation}",
-                    "-" * 40
-                ])
-            
-            return "\n".join(report_lines)
+        # Dispatch through the format table so each formatter stays a
+        # straight-line function; unknown formats fall back to text,
+        # matching the historical if/else behaviour
+        formatter = self._REPORT_FORMATTERS.get(output_format,
+                                                CISBenchmarkChecker._generate_text_report)
+        return formatter(self, results)
 
+    def _generate_json_report(self, results) -> str:
+        """Render results as a JSON report in one pass"""
+        # Counts and the serialized entries are built together, so a
+        # generator input is never materialized twice
+        counts = {status: 0 for status in ComplianceStatus}
+        result_entries = []
+        for result in results:
+            counts[result.status] += 1
+            result_entries.append(_result_entry(result))
 
-def main():
-    """Main CLI interface"""
-    parser = argparse.ArgumentParser(
-        description="AWS CIS Benchmark Compliance Checker",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+        report_data = {
+            "report_metadata": {
+                "timestamp": datetime.now(_UTC).isoformat(),
+                "account_id": self.account_id,
+                "region": self.region,
+                "total_checks": len(result_entries)
+            },
+            "summary": {
+                "compliant": counts[ComplianceStatus.COMPLIANT],
+                "non_compliant": counts[ComplianceStatus.NON_COMPLIANT],
+                "not_applicable": counts[ComplianceStatus.NOT_APPLICABLE],
+                "insufficient_data": counts[ComplianceStatus.INSUFFICIENT_DATA]
+            },
+            "results": result_entries
+        }
+        return _dumps(report_data)
+
+    def _generate_text_report(self, results) -> str:
+        """Render results as a plain-text report in one pass"""
+        # One f-string per result; details accumulate in a StringIO (an
+        # amortized growing buffer) rather than a list holding every line
+        # at once. The header needs the counts, so it is prepended after.
+        counts = {status: 0 for status in ComplianceStatus}
+        dash40 = "-" * 40
+        details = io.StringIO()
+        for result in results:
+            counts[result.status] += 1
+            details.write(
+                f"Control: {result.control_id}\n"
+                f"Status: {_STATUS_STR[result.status]}\n"
+                f"Resource: {result.resource_type}::{result.resource_id}\n"
+                f"Reason: {result.reason}\n"
+                f"Remediation: {result.remediation}\n"
+                f"{dash40}\n"
+            )
+
+        header = "\n".join([
+            "=" * 80,
+            "AWS CIS Benchmark Compliance Report",
+            "=" * 80,
+            f"Timestamp: {datetime.now(_UTC).isoformat()}",
+            f"Account ID: {self.account_id}",
+            f"Region: {self.region}",
+            f"Total Checks: {sum(counts.values())}",
+            "",
+            "SUMMARY",
+            dash40,
+            f"Compliant: {counts[ComplianceStatus.COMPLIANT]}",
+            f"Non-Compliant: {counts[ComplianceStatus.NON_COMPLIANT]}",
+            f"Not Applicable: {counts[ComplianceStatus.NOT_APPLICABLE]}",
+            f"Insufficient Data: {counts[ComplianceStatus.INSUFFICIENT_DATA]}",
+            "",
+            "DETAILED RESULTS",
+            dash40,
+            "",
+        ])
+
+        return header + details.getvalue().rstrip("\n")
+
+    # Format-name dispatch table for generate_report (unbound functions;
+    # generate_report passes self explicitly)
+    _REPORT_FORMATTERS = {
+        'json': _generate_json_report,
+        'text': _generate_text_report,
+    }
+
+
+# CLI constants built once at import rather than per main() call
+_EPILOG = """
 Examples:
   # Check all implemented controls
   python cis_checker.py check
@@ -777,7 +1172,16 @@ Examples:
 
   # Check different region
   python cis_checker.py check --region us-west-2
-        """
+"""
+_FORMATS = ('json', 'text')
+
+
+def main():
+    """Main CLI interface"""
+    parser = argparse.ArgumentParser(
+        description="AWS CIS Benchmark Compliance Checker",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument('--profile', help='AWS profile to use')
@@ -790,7 +1194,7 @@ Examples:
     check_parser = subparsers.add_parser('check', help='Run CIS benchmark checks')
     check_parser.add_argument('--controls', help='Comma-separated list of control IDs to check')
     check_parser.add_argument('--output', help='Output file path (default: stdout)')
-    check_parser.add_argument('--format', choices=['json', 'text'], default='json', help='Output format')
+    check_parser.add_argument('--format', choices=_FORMATS, default='json', help='Output format')
     
     # List command  
     list_parser = subparsers.add_parser('list', help='List available controls')
@@ -801,15 +1205,11 @@ Examples:
         logging.getLogger().setLevel(logging.DEBUG)
     
     if args.command == 'list':
-        checker = CISBenchmarkChecker(profile=args.profile, region=args.region)
+        # The control catalog is a module constant; listing it needs no
+        # checker, no boto3 session, and no credentials
         print("Available CIS Controls:")
         print("=" * 50)
-        for control_id, control in checker.cis_controls.items():
-            print(f"{control_id}: {control.title}")
-            print(f"  Service: {control.service}")
-            print(f"  Severity: {control.severity}")
-            print(f"  Automated: {control.automated}")
-            print()
+        print(_list_controls_text())
         return
     
     if args.command == 'check':
@@ -821,19 +1221,20 @@ Examples:
         if args.controls:
             control_ids = [c.strip() for c in args.controls.split(',')]
         
-        # Run checks
-        results = checker.run_check(control_ids)
-        
-        # Generate report
-        report = checker.generate_report(results, args.format)
-        
+        # Run checks, streaming results straight into the report
+        results = checker._iter_results(control_ids)
+
         # Output report
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(report)
+            # Write chunk by chunk so the report never exists as one string.
+            # Binary mode with a 1 MiB buffer skips the text-io codec layer
+            # and newline translation; chunks are encoded once each.
+            with open(args.output, 'wb', buffering=1 << 20) as f:
+                for chunk in checker.iter_report_chunks(results, args.format):
+                    f.write(chunk.encode('utf-8'))
             print(f"Report saved to {args.output}")
         else:
-            print(report)
+            print(checker.generate_report(results, args.format))
     else:
         parser.print_help()
 
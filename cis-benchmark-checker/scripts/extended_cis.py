@@ -6,161 +6,204 @@ Additional CIS benchmark checks for AWS services including IAM password policies
 KMS key management, S3 security, and advanced networking controls.
 """
 
-import boto3
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
+from functools import partial
 
 from cis_checker import CISBenchmarkChecker, ComplianceResult, ComplianceStatus
 
 logger = logging.getLogger(__name__)
 
+# Canonical public-grantee group URIs plus the ACL permissions that grant
+# public read/write. Frozensets give O(1) membership tests and avoid the
+# per-grant list allocation and substring scans of the old checks.
+_PUBLIC_GROUP_URIS = frozenset({
+    'http://acs.amazonaws.com/groups/global/AllUsers',
+    'http://acs.amazonaws.com/groups/global/AuthenticatedUsers',
+})
+_READ_PERMS = frozenset({'READ', 'FULL_CONTROL'})
+_WRITE_PERMS = frozenset({'WRITE', 'FULL_CONTROL'})
+
+# Sentinel distinguishing "not fetched yet" from a legitimately-None value
+_UNSET = object()
+
 class ExtendedCISChecker(CISBenchmarkChecker):
     """Extended CIS checker with additional control implementations"""
-    
+
+    def __init__(self, profile: Optional[str] = None, region: str = 'us-east-1',
+                 max_workers: int = 8):
+        """Initialize the extended checker and register its check methods"""
+        super().__init__(profile=profile, region=region, max_workers=max_workers)
+        # Registering here lets the parent's streaming _iter_results run
+        # the extended checks alongside the base ones — results are
+        # yielded as each control completes instead of being collected
+        # into one list per subclass. It also stops the parent reporting
+        # these controls NOT_APPLICABLE while the subclass checks them.
+        self._check_methods.update({
+            "1.5": self.check_control_1_5,
+            "1.6": self.check_control_1_6,
+            "3.2": self.check_control_3_2,
+            "3.3": self.check_control_3_3,
+            "3.8": self.check_control_3_8,
+            "5.5": self.check_control_5_5,
+        })
+
+        # Explicit double-checked locks rather than cached_property: the
+        # paired checks (1.5/1.6, 3.2/3.3) start simultaneously in the
+        # worker pool, and cached_property stopped locking in Python 3.12,
+        # which would let both threads fetch and defeat the memoization
+        self._password_policy_cache = _UNSET
+        self._password_policy_lock = threading.Lock()
+        self._trails_cache = _UNSET
+        self._trails_lock = threading.Lock()
+
+    @property
+    def _password_policy(self) -> Optional[Dict[str, Any]]:
+        """Account password policy, fetched once and shared by 1.5 and 1.6
+
+        Returns None when no policy is configured; the policy cannot
+        change between the two checks within a single run.
+        """
+        if self._password_policy_cache is _UNSET:
+            with self._password_policy_lock:
+                if self._password_policy_cache is _UNSET:
+                    try:
+                        policy = self.iam.get_account_password_policy()['PasswordPolicy']
+                    except self.iam.exceptions.NoSuchEntityException:
+                        policy = None
+                    self._password_policy_cache = policy
+        return self._password_policy_cache
+
+    @property
+    def _trails(self) -> List[Dict[str, Any]]:
+        """CloudTrail trail list, fetched once and shared by 3.2 and 3.3"""
+        if self._trails_cache is _UNSET:
+            with self._trails_lock:
+                if self._trails_cache is _UNSET:
+                    self._trails_cache = self.cloudtrail.describe_trails()['trailList']
+        return self._trails_cache
+
+    def _result(self, control_id: str, status: ComplianceStatus,
+                resource_id: str, resource_type: str, *,
+                reason: str, remediation: str, ts: str) -> ComplianceResult:
+        """Build a result, filling in the per-account constant fields
+
+        Each check computes its timestamp once and passes it as ts, so a
+        check over N resources takes one clock reading instead of N.
+        """
+        return ComplianceResult(
+            control_id=control_id,
+            status=status,
+            resource_id=resource_id,
+            resource_type=resource_type,
+            reason=reason,
+            remediation=remediation,
+            timestamp=ts,
+            region=self.region,
+            account_id=self.account_id
+        )
+
     def check_control_1_5(self) -> List[ComplianceResult]:
         """1.5 - Ensure IAM password policy requires minimum length of 14 or greater"""
         results = []
-        
+        ts = datetime.now(timezone.utc).isoformat()
+
         try:
-            password_policy = self.iam.get_account_password_policy()['PasswordPolicy']
+            password_policy = self._password_policy
+
+            if password_policy is None:
+                results.append(self._result(
+                                   "1.5", ComplianceStatus.NON_COMPLIANT, "account", "IAM::PasswordPolicy",
+                                   reason="No password policy configured",
+                                   remediation="Create IAM password policy with minimum 14 character length", ts=ts
+                               ))
+                return results
+
             min_length = password_policy.get('MinimumPasswordLength', 0)
-            
+
             if min_length >= 14:
-                results.append(ComplianceResult(
-                    control_id="1.5",
-                    status=ComplianceStatus.COMPLIANT,
-                    resource_id="account",
-                    resource_type="IAM::PasswordPolicy",
-                    reason=f"Password minimum length is {min_length}",
-                    remediation="No action needed",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
-                ))
+                results.append(self._result(
+                                   "1.5", ComplianceStatus.COMPLIANT, "account", "IAM::PasswordPolicy",
+                                   reason=f"Password minimum length is {min_length}",
+                                   remediation="No action needed", ts=ts
+                               ))
             else:
-                results.append(ComplianceResult(
-                    control_id="1.5",
-                    status=ComplianceStatus.NON_COMPLIANT,
-                    resource_id="account",
-                    resource_type="IAM::PasswordPolicy",
-                    reason=f"Password minimum length is {min_length}, should be 14+",
-                    remediation="Update password policy to require minimum 14 characters",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
-                ))
-                
-        except self.iam.exceptions.NoSuchEntityException:
-            results.append(ComplianceResult(
-                control_id="1.5",
-                status=ComplianceStatus.NON_COMPLIANT,
-                resource_id="account",
-                resource_type="IAM::PasswordPolicy",
-                reason="No password policy configured",
-                remediation="Create IAM password policy with minimum 14 character length",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
-            ))
+                results.append(self._result(
+                                   "1.5", ComplianceStatus.NON_COMPLIANT, "account", "IAM::PasswordPolicy",
+                                   reason=f"Password minimum length is {min_length}, should be 14+",
+                                   remediation="Update password policy to require minimum 14 characters", ts=ts
+                               ))
+
         except Exception as e:
             logger.error(f"Error checking control 1.5: {e}")
-            results.append(ComplianceResult(
-                control_id="1.5",
-                status=ComplianceStatus.INSUFFICIENT_DATA,
-                resource_id="account",
-                resource_type="IAM::PasswordPolicy",
-                reason=f"Error during check: {e}",
-                remediation="Review IAM permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
-            ))
+            results.append(self._result(
+                               "1.5", ComplianceStatus.INSUFFICIENT_DATA, "account", "IAM::PasswordPolicy",
+                               reason=f"Error during check: {e}",
+                               remediation="Review IAM permissions and retry", ts=ts
+                           ))
             
         return results
 
     def check_control_1_6(self) -> List[ComplianceResult]:
         """1.6 - Ensure IAM password policy prevents password reuse"""
         results = []
+        ts = datetime.now(timezone.utc).isoformat()
         
         try:
-            password_policy = self.iam.get_account_password_policy()['PasswordPolicy']
+            password_policy = self._password_policy
+
+            if password_policy is None:
+                results.append(self._result(
+                                   "1.6", ComplianceStatus.NON_COMPLIANT, "account", "IAM::PasswordPolicy",
+                                   reason="No password policy configured",
+                                   remediation="Create IAM password policy with password reuse prevention", ts=ts
+                               ))
+                return results
+
             password_reuse_prevention = password_policy.get('PasswordReusePrevention', 0)
-            
+
             if password_reuse_prevention >= 24:
-                results.append(ComplianceResult(
-                    control_id="1.6",
-                    status=ComplianceStatus.COMPLIANT,
-                    resource_id="account",
-                    resource_type="IAM::PasswordPolicy",
-                    reason=f"Password reuse prevention set to {password_reuse_prevention}",
-                    remediation="No action needed",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
-                ))
+                results.append(self._result(
+                                   "1.6", ComplianceStatus.COMPLIANT, "account", "IAM::PasswordPolicy",
+                                   reason=f"Password reuse prevention set to {password_reuse_prevention}",
+                                   remediation="No action needed", ts=ts
+                               ))
             else:
-                results.append(ComplianceResult(
-                    control_id="1.6",
-                    status=ComplianceStatus.NON_COMPLIANT,
-                    resource_id="account",
-                    resource_type="IAM::PasswordPolicy",
-                    reason=f"Password reuse prevention is {password_reuse_prevention}, should be 24+",
-                    remediation="Update password policy to prevent reuse of last 24 passwords",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
-                ))
-                
-        except self.iam.exceptions.NoSuchEntityException:
-            results.append(ComplianceResult(
-                control_id="1.6",
-                status=ComplianceStatus.NON_COMPLIANT,
-                resource_id="account",
-                resource_type="IAM::PasswordPolicy",
-                reason="No password policy configured",
-                remediation="Create IAM password policy with password reuse prevention",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
-            ))
+                results.append(self._result(
+                                   "1.6", ComplianceStatus.NON_COMPLIANT, "account", "IAM::PasswordPolicy",
+                                   reason=f"Password reuse prevention is {password_reuse_prevention}, should be 24+",
+                                   remediation="Update password policy to prevent reuse of last 24 passwords", ts=ts
+                               ))
+
         except Exception as e:
             logger.error(f"Error checking control 1.6: {e}")
-            results.append(ComplianceResult(
-                control_id="1.6",
-                status=ComplianceStatus.INSUFFICIENT_DATA,
-                resource_id="account",
-                resource_type="IAM::PasswordPolicy",
-                reason=f"Error during check: {e}",
-                remediation="Review IAM permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
-            ))
+            results.append(self._result(
+                               "1.6", ComplianceStatus.INSUFFICIENT_DATA, "account", "IAM::PasswordPolicy",
+                               reason=f"Error during check: {e}",
+                               remediation="Review IAM permissions and retry", ts=ts
+                           ))
             
         return results
 
     def check_control_3_2(self) -> List[ComplianceResult]:
         """3.2 - Ensure CloudTrail log file validation is enabled"""
         results = []
+        ts = datetime.now(timezone.utc).isoformat()
         
         try:
-            trails = self.cloudtrail.describe_trails()['trailList']
+            trails = self._trails
             
             if not trails:
-                results.append(ComplianceResult(
-                    control_id="3.2",
-                    status=ComplianceStatus.NON_COMPLIANT,
-                    resource_id="N/A",
-                    resource_type="CloudTrail",
-                    reason="No CloudTrail trails found",
-                    remediation="Create CloudTrail with log file validation enabled",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
-                ))
+                results.append(self._result(
+                                   "3.2", ComplianceStatus.NON_COMPLIANT, "N/A", "CloudTrail",
+                                   reason="No CloudTrail trails found",
+                                   remediation="Create CloudTrail with log file validation enabled", ts=ts
+                               ))
                 return results
             
             for trail in trails:
@@ -168,385 +211,262 @@ class ExtendedCISChecker(CISBenchmarkChecker):
                 log_file_validation = trail.get('LogFileValidationEnabled', False)
                 
                 if log_file_validation:
-                    results.append(ComplianceResult(
-                        control_id="3.2",
-                        status=ComplianceStatus.COMPLIANT,
-                        resource_id=trail_name,
-                        resource_type="CloudTrail::Trail",
-                        reason="Log file validation is enabled",
-                        remediation="No action needed",
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        region=self.region,
-                        account_id=self.account_id
-                    ))
+                    results.append(self._result(
+                                       "3.2", ComplianceStatus.COMPLIANT, trail_name, "CloudTrail::Trail",
+                                       reason="Log file validation is enabled",
+                                       remediation="No action needed", ts=ts
+                                   ))
                 else:
-                    results.append(ComplianceResult(
-                        control_id="3.2",
-                        status=ComplianceStatus.NON_COMPLIANT,
-                        resource_id=trail_name,
-                        resource_type="CloudTrail::Trail",
-                        reason="Log file validation is disabled",
-                        remediation="Enable log file validation for CloudTrail",
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        region=self.region,
-                        account_id=self.account_id
-                    ))
+                    results.append(self._result(
+                                       "3.2", ComplianceStatus.NON_COMPLIANT, trail_name, "CloudTrail::Trail",
+                                       reason="Log file validation is disabled",
+                                       remediation="Enable log file validation for CloudTrail", ts=ts
+                                   ))
                     
         except Exception as e:
             logger.error(f"Error checking control 3.2: {e}")
-            results.append(ComplianceResult(
-                control_id="3.2",
-                status=ComplianceStatus.INSUFFICIENT_DATA,
-                resource_id="N/A",
-                resource_type="CloudTrail",
-                reason=f"Error during check: {e}",
-                remediation="Review CloudTrail permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
-            ))
+            results.append(self._result(
+                               "3.2", ComplianceStatus.INSUFFICIENT_DATA, "N/A", "CloudTrail",
+                               reason=f"Error during check: {e}",
+                               remediation="Review CloudTrail permissions and retry", ts=ts
+                           ))
             
         return results
 
     def check_control_3_3(self) -> List[ComplianceResult]:
         """3.3 - Ensure the S3 bucket used to store CloudTrail logs is not publicly accessible"""
         results = []
+        ts = datetime.now(timezone.utc).isoformat()
         
         try:
-            trails = self.cloudtrail.describe_trails()['trailList']
+            trails = self._trails
             
             if not trails:
-                results.append(ComplianceResult(
-                    control_id="3.3",
-                    status=ComplianceStatus.NOT_APPLICABLE,
-                    resource_id="N/A",
-                    resource_type="CloudTrail",
-                    reason="No CloudTrail trails found",
-                    remediation="Create CloudTrail with secure S3 bucket",
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    region=self.region,
-                    account_id=self.account_id
-                ))
+                results.append(self._result(
+                                   "3.3", ComplianceStatus.NOT_APPLICABLE, "N/A", "CloudTrail",
+                                   reason="No CloudTrail trails found",
+                                   remediation="Create CloudTrail with secure S3 bucket", ts=ts
+                               ))
                 return results
             
-            for trail in trails:
-                trail_name = trail['Name']
-                s3_bucket = trail.get('S3BucketName')
-                
-                if not s3_bucket:
-                    continue
-                
-                try:
-                    # Check bucket ACL
-                    acl = self.s3.get_bucket_acl(Bucket=s3_bucket)
-                    public_read = False
-                    public_write = False
-                    
-                    for grant in acl['Grants']:
-                        grantee = grant.get('Grantee', {})
-                        if grantee.get('Type') == 'Group':
-                            uri = grantee.get('URI', '')
-                            if 'AllUsers' in uri or 'AuthenticatedUsers' in uri:
-                                permission = grant['Permission']
-                                if permission in ['READ', 'FULL_CONTROL']:
-                                    public_read = True
-                                if permission in ['WRITE', 'FULL_CONTROL']:
-                                    public_write = True
-                    
+            # Several trails commonly log to the same bucket; dedupe up
+            # front so each bucket is checked (and billed) exactly once
+            buckets = {trail['S3BucketName'] for trail in trails
+                       if trail.get('S3BucketName')}
+
+            # Buckets are independent, so check them concurrently
+            with ThreadPoolExecutor(max_workers=min(len(buckets), 16) or 1) as executor:
+                for result in executor.map(partial(self._check_bucket_public, ts=ts),
+                                           sorted(buckets)):
+                    results.append(result)
+
+        except Exception as e:
+            logger.error(f"Error checking control 3.3: {e}")
+            results.append(self._result(
+                               "3.3", ComplianceStatus.INSUFFICIENT_DATA, "N/A", "S3",
+                               reason=f"Error during check: {e}",
+                               remediation="Review permissions and retry", ts=ts
+                           ))
+            
+        return results
+
+    def _check_bucket_public(self, s3_bucket: str, ts: str) -> ComplianceResult:
+        """Classify one CloudTrail bucket's public exposure for control 3.3
+
+        The ACL is fetched first: any public grant already settles the
+        classification as NON_COMPLIANT, so the policy and public access
+        block round-trips are skipped entirely. Otherwise they are issued
+        concurrently and the bucket pays only the slower of the two.
+        """
+        try:
+            public_read = False
+            public_write = False
+
+            # Check bucket ACL
+            for grant in self.s3.get_bucket_acl(Bucket=s3_bucket)['Grants']:
+                grantee = grant.get('Grantee', {})
+                if (grantee.get('Type') == 'Group'
+                        and grantee.get('URI') in _PUBLIC_GROUP_URIS):
+                    permission = grant['Permission']
+                    if permission in _READ_PERMS:
+                        public_read = True
+                    if permission in _WRITE_PERMS:
+                        public_write = True
+
+            if not (public_read or public_write):
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    policy_future = executor.submit(self.s3.get_bucket_policy, Bucket=s3_bucket)
+                    pab_future = executor.submit(self.s3.get_public_access_block, Bucket=s3_bucket)
+
                     # Check bucket policy for public access
                     try:
-                        bucket_policy = self.s3.get_bucket_policy(Bucket=s3_bucket)
-                        policy = json.loads(bucket_policy['Policy'])
-                        
+                        policy = json.loads(policy_future.result()['Policy'])
                         for statement in policy.get('Statement', []):
                             principal = statement.get('Principal')
                             if principal == '*' or (isinstance(principal, dict) and principal.get('AWS') == '*'):
                                 effect = statement.get('Effect')
                                 if effect == 'Allow':
                                     public_read = True
-                                    
+                                    break  # One public Allow is conclusive
                     except self.s3.exceptions.NoSuchBucketPolicy:
                         pass  # No bucket policy is fine
-                    
+
                     # Check public access block
                     try:
-                        public_access_block = self.s3.get_public_access_block(Bucket=s3_bucket)
-                        pab = public_access_block['PublicAccessBlockConfiguration']
-                        
-                        if not (pab.get('BlockPublicAcls', False) and 
-                               pab.get('IgnorePublicAcls', False) and
-                               pab.get('BlockPublicPolicy', False) and
-                               pab.get('RestrictPublicBuckets', False)):
+                        pab = pab_future.result()['PublicAccessBlockConfiguration']
+                        if not (pab.get('BlockPublicAcls', False) and
+                                pab.get('IgnorePublicAcls', False) and
+                                pab.get('BlockPublicPolicy', False) and
+                                pab.get('RestrictPublicBuckets', False)):
                             public_read = True
-                            
                     except self.s3.exceptions.NoSuchPublicAccessBlockConfiguration:
                         public_read = True  # No public access block means potentially public
-                    
-                    if public_read or public_write:
-                        results.append(ComplianceResult(
-                            control_id="3.3",
-                            status=ComplianceStatus.NON_COMPLIANT,
-                            resource_id=s3_bucket,
-                            resource_type="S3::Bucket",
-                            reason="CloudTrail S3 bucket has public access",
-                            remediation="Enable S3 public access block and review bucket policy/ACL",
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            region=self.region,
-                            account_id=self.account_id
-                        ))
-                    else:
-                        results.append(ComplianceResult(
-                            control_id="3.3",
-                            status=ComplianceStatus.COMPLIANT,
-                            resource_id=s3_bucket,
-                            resource_type="S3::Bucket",
-                            reason="CloudTrail S3 bucket is not publicly accessible",
-                            remediation="No action needed",
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            region=self.region,
-                            account_id=self.account_id
-                        ))
-                        
-                except Exception as e:
-                    logger.warning(f"Could not check bucket {s3_bucket}: {e}")
-                    results.append(ComplianceResult(
-                        control_id="3.3",
-                        status=ComplianceStatus.INSUFFICIENT_DATA,
-                        resource_id=s3_bucket,
-                        resource_type="S3::Bucket",
-                        reason=f"Error checking bucket: {e}",
-                        remediation="Review S3 permissions and retry",
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        region=self.region,
-                        account_id=self.account_id
-                    ))
-                    
+
+            if public_read or public_write:
+                return self._result(
+                           "3.3", ComplianceStatus.NON_COMPLIANT, s3_bucket, "S3::Bucket",
+                           reason="CloudTrail S3 bucket has public access",
+                           remediation="Enable S3 public access block and review bucket policy/ACL", ts=ts
+                       )
+            return self._result(
+                       "3.3", ComplianceStatus.COMPLIANT, s3_bucket, "S3::Bucket",
+                       reason="CloudTrail S3 bucket is not publicly accessible",
+                       remediation="No action needed", ts=ts
+                   )
+
         except Exception as e:
-            logger.error(f"Error checking control 3.3: {e}")
-            results.append(ComplianceResult(
-                control_id="3.3",
-                status=ComplianceStatus.INSUFFICIENT_DATA,
-                resource_id="N/A",
-                resource_type="S3",
-                reason=f"Error during check: {e}",
-                remediation="Review permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
-            ))
-            
-        return results
+            logger.warning(f"Could not check bucket {s3_bucket}: {e}")
+            return self._result(
+                       "3.3", ComplianceStatus.INSUFFICIENT_DATA, s3_bucket, "S3::Bucket",
+                       reason=f"Error checking bucket: {e}",
+                       remediation="Review S3 permissions and retry", ts=ts
+                   )
 
     def check_control_3_8(self) -> List[ComplianceResult]:
         """3.8 - Ensure rotation for customer-created CMKs is enabled"""
         results = []
+        ts = datetime.now(timezone.utc).isoformat()
         
         try:
+            # Collect key IDs first (large pages cut pagination round-trips),
+            # then fan the per-key describe/rotation calls out over threads:
+            # two serial calls per key would otherwise cost 2N round-trips
             paginator = self.kms.get_paginator('list_keys')
-            
-            for page in paginator.paginate():
-                for key in page['Keys']:
-                    key_id = key['KeyId']
-                    
-                    try:
-                        # Get key details
-                        key_details = self.kms.describe_key(KeyId=key_id)['KeyMetadata']
-                        
-                        # Skip AWS managed keys
-                        if key_details.get('KeyManager') == 'AWS':
-                            continue
-                        
-                        # Check if key rotation is enabled
-                        rotation_status = self.kms.get_key_rotation_status(KeyId=key_id)
-                        key_rotation_enabled = rotation_status['KeyRotationEnabled']
-                        
-                        if key_rotation_enabled:
-                            results.append(ComplianceResult(
-                                control_id="3.8",
-                                status=ComplianceStatus.COMPLIANT,
-                                resource_id=key_id,
-                                resource_type="KMS::Key",
-                                reason="Key rotation is enabled",
-                                remediation="No action needed",
-                                timestamp=datetime.now(timezone.utc).isoformat(),
-                                region=self.region,
-                                account_id=self.account_id
-                            ))
-                        else:
-                            results.append(ComplianceResult(
-                                control_id="3.8",
-                                status=ComplianceStatus.NON_COMPLIANT,
-                                resource_id=key_id,
-                                resource_type="KMS::Key",
-                                reason="Key rotation is disabled",
-                                remediation="Enable automatic key rotation",
-                                timestamp=datetime.now(timezone.utc).isoformat(),
-                                region=self.region,
-                                account_id=self.account_id
-                            ))
-                            
-                    except Exception as e:
-                        logger.warning(f"Could not check key {key_id}: {e}")
-                        results.append(ComplianceResult(
-                            control_id="3.8",
-                            status=ComplianceStatus.INSUFFICIENT_DATA,
-                            resource_id=key_id,
-                            resource_type="KMS::Key",
-                            reason=f"Error checking key: {e}",
-                            remediation="Review KMS permissions and retry",
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            region=self.region,
-                            account_id=self.account_id
-                        ))
-                        
+            key_ids = [key['KeyId']
+                       for page in paginator.paginate(PaginationConfig={'PageSize': 1000})
+                       for key in page['Keys']]
+
+            if key_ids:
+                with ThreadPoolExecutor(max_workers=min(len(key_ids), 32)) as executor:
+                    for result in executor.map(partial(self._check_key_rotation, ts=ts),
+                                               key_ids):
+                        if result is not None:
+                            results.append(result)
+
         except Exception as e:
             logger.error(f"Error checking control 3.8: {e}")
-            results.append(ComplianceResult(
-                control_id="3.8",
-                status=ComplianceStatus.INSUFFICIENT_DATA,
-                resource_id="N/A",
-                resource_type="KMS",
-                reason=f"Error during check: {e}",
-                remediation="Review KMS permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
-            ))
+            results.append(self._result(
+                               "3.8", ComplianceStatus.INSUFFICIENT_DATA, "N/A", "KMS",
+                               reason=f"Error during check: {e}",
+                               remediation="Review KMS permissions and retry", ts=ts
+                           ))
             
         return results
 
+    def _check_key_rotation(self, key_id: str, ts: str) -> Optional[ComplianceResult]:
+        """Check one CMK's rotation status for control 3.8
+
+        Returns None for AWS-managed keys, which rotate automatically and
+        are out of scope for the control.
+        """
+        try:
+            key_details = self.kms.describe_key(KeyId=key_id)['KeyMetadata']
+
+            # Skip AWS managed keys
+            if key_details.get('KeyManager') == 'AWS':
+                return None
+
+            rotation_status = self.kms.get_key_rotation_status(KeyId=key_id)
+
+            if rotation_status['KeyRotationEnabled']:
+                return self._result(
+                           "3.8", ComplianceStatus.COMPLIANT, key_id, "KMS::Key",
+                           reason="Key rotation is enabled",
+                           remediation="No action needed", ts=ts
+                       )
+            return self._result(
+                       "3.8", ComplianceStatus.NON_COMPLIANT, key_id, "KMS::Key",
+                       reason="Key rotation is disabled",
+                       remediation="Enable automatic key rotation", ts=ts
+                   )
+
+        except Exception as e:
+            logger.warning(f"Could not check key {key_id}: {e}")
+            return self._result(
+                       "3.8", ComplianceStatus.INSUFFICIENT_DATA, key_id, "KMS::Key",
+                       reason=f"Error checking key: {e}",
+                       remediation="Review KMS permissions and retry", ts=ts
+                   )
+
     def check_control_5_5(self) -> List[ComplianceResult]:
         """5.5 - Ensure VPC flow logging is enabled in all VPCs"""
         results = []
+        ts = datetime.now(timezone.utc).isoformat()
         
         try:
-            # Get all VPCs
-            vpcs = self.ec2.describe_vpcs()['Vpcs']
-            
-            # Get all flow logs
-            flow_logs = self.ec2.describe_flow_logs()['FlowLogs']
-            
-            # Create mapping of VPC to flow logs
-            vpc_flow_logs = {}
-            for flow_log in flow_logs:
-                if flow_log['ResourceType'] == 'VPC':
-                    vpc_id = flow_log['ResourceId']
-                    if vpc_id not in vpc_flow_logs:
-                        vpc_flow_logs[vpc_id] = []
-                    vpc_flow_logs[vpc_id].append(flow_log)
-            
-            for vpc in vpcs:
-                vpc_id = vpc['VpcId']
-                
-                if vpc_id in vpc_flow_logs:
-                    # Check if any flow log is active
-                    active_flow_logs = [fl for fl in vpc_flow_logs[vpc_id] 
-                                      if fl['FlowLogStatus'] == 'ACTIVE']
-                    
-                    if active_flow_logs:
-                        results.append(ComplianceResult(
-                            control_id="5.5",
-                            status=ComplianceStatus.COMPLIANT,
-                            resource_id=vpc_id,
-                            resource_type="EC2::VPC",
-                            reason="VPC Flow Logs are enabled",
-                            remediation="No action needed",
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            region=self.region,
-                            account_id=self.account_id
-                        ))
+            # Paginate flow logs (the single call silently caps out on big
+            # accounts) and filter to VPC-scoped logs server-side, so
+            # subnet/ENI flow-log records never cross the wire. The status
+            # stays client-side because the check distinguishes inactive
+            # logs from absent ones, which a flow-log-status filter would
+            # collapse together.
+            paginator = self.ec2.get_paginator('describe_flow_logs')
+            configured_vpc_ids = set()
+            active_vpc_ids = set()
+            pages = paginator.paginate(
+                Filters=[{'Name': 'resource-type', 'Values': ['VPC']}])
+            for vpc_id, status in pages.search(
+                    "FlowLogs[].[ResourceId, FlowLogStatus]"):
+                configured_vpc_ids.add(vpc_id)
+                if status == 'ACTIVE':
+                    active_vpc_ids.add(vpc_id)
+
+            # Paginate VPCs as well; the bare call stops at the first page
+            vpc_pages = self.ec2.get_paginator('describe_vpcs').paginate()
+            for vpc_id in vpc_pages.search('Vpcs[].VpcId'):
+                if vpc_id in configured_vpc_ids:
+                    if vpc_id in active_vpc_ids:
+                        results.append(self._result(
+                                           "5.5", ComplianceStatus.COMPLIANT, vpc_id, "EC2::VPC",
+                                           reason="VPC Flow Logs are enabled",
+                                           remediation="No action needed", ts=ts
+                                       ))
                     else:
-                        results.append(ComplianceResult(
-                            control_id="5.5",
-                            status=ComplianceStatus.NON_COMPLIANT,
-                            resource_id=vpc_id,
-                            resource_type="EC2::VPC",
-                            reason="VPC Flow Logs exist but are not active",
-                            remediation="Activate VPC Flow Logs",
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            region=self.region,
-                            account_id=self.account_id
-                        ))
+                        results.append(self._result(
+                                           "5.5", ComplianceStatus.NON_COMPLIANT, vpc_id, "EC2::VPC",
+                                           reason="VPC Flow Logs exist but are not active",
+                                           remediation="Activate VPC Flow Logs", ts=ts
+                                       ))
                 else:
-                    results.append(ComplianceResult(
-                        control_id="5.5",
-                        status=ComplianceStatus.NON_COMPLIANT,
-                        resource_id=vpc_id,
-                        resource_type="EC2::VPC",
-                        reason="No VPC Flow Logs configured",
-                        remediation="Enable VPC Flow Logs",
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        region=self.region,
-                        account_id=self.account_id
-                    ))
+                    results.append(self._result(
+                                       "5.5", ComplianceStatus.NON_COMPLIANT, vpc_id, "EC2::VPC",
+                                       reason="No VPC Flow Logs configured",
+                                       remediation="Enable VPC Flow Logs", ts=ts
+                                   ))
                     
         except Exception as e:
             logger.error(f"Error checking control 5.5: {e}")
-            results.append(ComplianceResult(
-                control_id="5.5",
-                status=ComplianceStatus.INSUFFICIENT_DATA,
-                resource_id="N/A",
-                resource_type="EC2::VPC",
-                reason=f"Error during check: {e}",
-                remediation="Review EC2 permissions and retry",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                region=self.region,
-                account_id=self.account_id
-            ))
+            results.append(self._result(
+                               "5.5", ComplianceStatus.INSUFFICIENT_DATA, "N/A", "EC2::VPC",
+                               reason=f"Error during check: {e}",
+                               remediation="Review EC2 permissions and retry", ts=ts
+                           ))
             
         return results
 
-    def run_check(self, control_ids: Optional[List[str]] = None) -> List[ComplianceResult]:
-        """
-        Run extended CIS benchmark checks
-        
-        Args:
-            control_ids: Specific control IDs to check (if None, check all)
-            
-        Returns:
-            List of compliance results
-        """
-        # Add extended check methods
-        extended_check_methods = {
-            "1.5": self.check_control_1_5,
-            "1.6": self.check_control_1_6,
-            "3.2": self.check_control_3_2,
-            "3.3": self.check_control_3_3,
-            "3.8": self.check_control_3_8,
-            "5.5": self.check_control_5_5,
-        }
-        
-        # Get results from parent class
-        results = super().run_check(control_ids)
-        
-        # If specific controls were requested, filter extended methods
-        if control_ids is None:
-            check_control_ids = list(extended_check_methods.keys())
-        else:
-            check_control_ids = [cid for cid in control_ids if cid in extended_check_methods]
-        
-        # Run extended checks
-        for control_id in check_control_ids:
-            if control_id in extended_check_methods:
-                logger.info(f"Running extended check for control {control_id}")
-                try:
-                    extended_results = extended_check_methods[control_id]()
-                    results.extend(extended_results)
-                except Exception as e:
-                    logger.error(f"Error in extended check for control {control_id}: {e}")
-                    results.append(ComplianceResult(
-                        control_id=control_id,
-                        status=ComplianceStatus.INSUFFICIENT_DATA,
-                        resource_id="N/A",
-                        resource_type="Unknown",
-                        reason=f"Extended check failed: {e}",
-                        remediation="Review implementation and retry",
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        region=self.region,
-                        account_id=self.account_id
-                    ))
-        
-        return results
+    # run_check and _iter_results are inherited: the extended methods are
+    # registered in _check_methods, so the parent's streaming generator
+    # schedules base and extended controls in the same worker pool.
 
 def main():
     """Main CLI interface for extended CIS checker"""
@@ -598,19 +518,18 @@ def main():
         if args.controls:
             control_ids = [c.strip() for c in args.controls.split(',')]
         
-        # Run checks
-        results = checker.run_check(control_ids)
-        
-        # Generate report
-        report = checker.generate_report(results, args.format)
-        
+        # Run checks, streaming results straight into the report
+        results = checker._iter_results(control_ids)
+
         # Output report
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(report)
+            # Write chunk by chunk so the report never exists as one string
+            with open(args.output, 'wb', buffering=1 << 20) as f:
+                for chunk in checker.iter_report_chunks(results, args.format):
+                    f.write(chunk.encode('utf-8'))
             print(f"Report saved to {args.output}")
         else:
-            print(report)
+            print(checker.generate_report(results, args.format))
     else:
         parser.print_help()
 
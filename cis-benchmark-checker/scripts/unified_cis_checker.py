@@ -43,23 +43,25 @@ def main():
     # Import and run appropriate checker
     if args.platform == "aws":
         try:
-            from cis_checker import CISBenchmarkChecker
-            
-            checker = CISBenchmarkChecker(
-                profile=args.profile,
-                region=args.region
-            )
-            
+            from cis_checker import CISBenchmarkChecker, _CIS_CONTROLS
+
             if args.command == "list":
+                # Listing reads the module-level catalog directly; no
+                # checker (and so no boto3 session) is needed
                 print("Available CIS Controls:")
                 print("=" * 50)
-                for control_id, control in checker.cis_controls.items():
+                for control_id, control in _CIS_CONTROLS.items():
                     print(f"{control_id}: {control.title}")
                     print(f"  Service: {control.service}")
                     print(f"  Severity: {control.severity}")
                 return
-            
+
             elif args.command == "check":
+                checker = CISBenchmarkChecker(
+                    profile=args.profile,
+                    region=args.region
+                )
+
                 control_ids = None
                 if args.controls:
                     control_ids = [c.strip() for c in args.controls.split(",")]